@@ -3,42 +3,29 @@ Advent of Code 2022 Day 1: Calorie Counting
 https://adventofcode.com/2022/day/1
 """
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
 
 
-def group_number_lines(lines: list[str]) -> list[list[int]]:
-    num_groups: list[list[int]] = []
-    current_group: list[int] = []
+def parse(puzzle: PuzzleInput) -> list[list[int]]:
+    return [[int(line) for line in group] for group in puzzle.paragraphs()]
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            num_groups.append(current_group)
-            current_group = []
-            continue
 
-        current_group.append(int(line))
+def part1(fruit_groups: list[list[int]]) -> int:
+    return max(sum(fruits) for fruits in fruit_groups)
 
-    if current_group:
-        num_groups.append(current_group)
 
-    return num_groups
+def part2(fruit_groups: list[list[int]]) -> int:
+    max_calorie_rank = sorted((sum(fruits) for fruits in fruit_groups), reverse=True)
+    return sum(max_calorie_rank[:3])
 
 
 if __name__ == "__main__":
     args = get_user_input(2022, 1)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+    with args["input"] as puzzle:
+        fruit_groups = parse(puzzle)
 
     if args["part"] == 1:
-        fruit_groups = group_number_lines(lines)
-        max_calories = max(sum(fruits) for fruits in fruit_groups)
-        print(f"Elf carrying the most calories has {max_calories}.")
+        print(f"Elf carrying the most calories has {part1(fruit_groups)}.")
     elif args["part"] == 2:
-        fruit_groups = group_number_lines(lines)
-        max_calorie_rank = sorted(
-            (sum(fruits) for fruits in fruit_groups), reverse=True
-        )
-        sum_of_three = sum(max_calorie_rank[:3])
-        print(f"The 3 elves carrying the most calories have {sum_of_three}.")
+        print(f"The 3 elves carrying the most calories have {part2(fruit_groups)}.")
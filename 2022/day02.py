@@ -5,7 +5,7 @@ https://adventofcode.com/2022/day/2
 
 from enum import IntEnum
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
 
 
 class Choice(IntEnum):
@@ -81,6 +81,10 @@ def player_move_for_round(opponent: Choice, outcome: Outcome) -> Choice:
             return opponent
 
 
+def parse(puzzle: PuzzleInput) -> list[str]:
+    return list(puzzle)
+
+
 def part1(lines: list[str]) -> int:
     score_sum = 0
 
@@ -121,8 +125,8 @@ def part2(lines: list[str]) -> int:
 if __name__ == "__main__":
     args = get_user_input(2022, 2)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+    with args["input"] as puzzle:
+        lines = parse(puzzle)
 
     if args["part"] == 1:
         print(f"The score sum is {part1(lines)}.")
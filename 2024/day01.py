@@ -3,7 +3,7 @@ Advent of Code 2024 Day 1: Historian Hysteria
 https://adventofcode.com/2024/day/1
 """
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
 
 
 def get_distance_sum(pairs: list[list[int]]) -> int:
@@ -39,15 +39,25 @@ def get_similarity_score(pairs: list[list[int]]) -> int:
     return sum(item * right.count(item) for item in left)
 
 
+def parse(puzzle: PuzzleInput) -> list[list[int]]:
+    return [list(pair) for pair in puzzle.ints()]
+
+
+def part1(pair_list: list[list[int]]) -> int:
+    return get_distance_sum(pair_list)
+
+
+def part2(pair_list: list[list[int]]) -> int:
+    return get_similarity_score(pair_list)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 1)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
-
-    pair_list = [[int(n) for n in line.split()] for line in lines]
+    with args["input"] as puzzle:
+        pair_list = parse(puzzle)
 
     if args["part"] == 1:
-        print(f"Distance sum: {get_distance_sum(pair_list)}")
+        print(f"Distance sum: {part1(pair_list)}")
     elif args["part"] == 2:
-        print(f"Similarity score: {get_similarity_score(pair_list)}")
+        print(f"Similarity score: {part2(pair_list)}")
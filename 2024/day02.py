@@ -3,7 +3,7 @@ Advent of Code 2024 Day 2: Red-Nosed Reports
 https://adventofcode.com/2024/day/2
 """
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
 
 
 def is_group_safe(group: list[int]) -> bool:
@@ -68,15 +68,25 @@ def get_dampened_group_count(groups: list[list[int]]) -> int:
     return sum(is_dampened_group_safe(group) for group in groups)
 
 
+def parse(puzzle: PuzzleInput) -> list[list[int]]:
+    return [list(levels) for levels in puzzle.ints()]
+
+
+def part1(level_groups: list[list[int]]) -> int:
+    return get_safe_group_count(level_groups)
+
+
+def part2(level_groups: list[list[int]]) -> int:
+    return get_dampened_group_count(level_groups)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 2)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
-
-    level_groups = [[int(n) for n in line.split()] for line in lines]
+    with args["input"] as puzzle:
+        level_groups = parse(puzzle)
 
     if args["part"] == 1:
-        print(f"Safe groups: {get_safe_group_count(level_groups)}")
+        print(f"Safe groups: {part1(level_groups)}")
     elif args["part"] == 2:
-        print(f"Safe groups (with dampening): {get_dampened_group_count(level_groups)}")
+        print(f"Safe groups (with dampening): {part2(level_groups)}")
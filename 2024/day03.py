@@ -5,7 +5,7 @@ https://adventofcode.com/2024/day/3
 
 import re
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
 
 
 def sum_mul_operators(data: str, *, conditioned: bool) -> int:
@@ -41,15 +41,25 @@ def sum_mul_operators(data: str, *, conditioned: bool) -> int:
     return sum(mults)
 
 
+def parse(puzzle: PuzzleInput) -> str:
+    return puzzle.text()
+
+
+def part1(data: str) -> int:
+    return sum_mul_operators(data, conditioned=False)
+
+
+def part2(data: str) -> int:
+    return sum_mul_operators(data, conditioned=True)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 3)
 
-    with args["input_file"] as fp:
-        data = fp.read()
+    with args["input"] as puzzle:
+        data = parse(puzzle)
 
     if args["part"] == 1:
-        print(f"Sum of multiplications: {sum_mul_operators(data, conditioned=False)}")
+        print(f"Sum of multiplications: {part1(data)}")
     elif args["part"] == 2:
-        print(
-            f"Sum of multiplications (conditioned): {sum_mul_operators(data, conditioned=True)}"
-        )
+        print(f"Sum of multiplications (conditioned): {part2(data)}")
@@ -5,105 +5,80 @@ https://adventofcode.com/2024/day/4
 
 from itertools import product
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
+from aocutils.arraygrid import FastGrid
 
 
-class Grid:
-    """A grid of NxM length."""
+FIRST_TARGETS = ("XMAS", "SAMX")
+SECOND_TARGETS = ("MAS", "SAM")
 
-    def __init__(self, cells: list[str]) -> None:
-        """
-        Arguments:
-            cells (list[str]):
-                A list of rows representing the grid.
-        """
-        self.cells = cells
-        self.width = len(self.cells[0])
-        self.height = len(self.cells)
+# (dx, dy) directions in which words are searched: horizontally, vertically,
+# diagonally and anti-diagonally.
+WORD_DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
 
-    def matches_horizontally(self, x: int, y: int, targets: tuple[str, ...]) -> bool:
-        """Returns whether any of ``targets`` matches horizontally from position (x, y)."""
-        return y < self.height and self.cells[y][x:].startswith(targets)
 
-    def matches_vertically(self, x: int, y: int, targets: tuple[str, ...]) -> bool:
-        """Returns whether any of ``targets`` matches vertically from position (x, y)."""
-        return "".join(
-            row[x : x + 1] for row in self.cells[y : y + len(max(targets, key=len))]
-        ).startswith(targets)
+def make_cross_pattern(diagonal: str, antidiagonal: str) -> list[str] | None:
+    """Returns a square pattern where ``diagonal`` is read from its top left corner and
+    ``antidiagonal`` from its top right corner, with every other cell left as a wildcard.
 
-    def matches_diagonally(
-        self, x: int, y: int, targets: tuple[str, ...]
-    ) -> tuple[bool, bool]:
-        """Checks whether any of ``targets`` matches diagonally from position (x, y).
+    Returns None if both words cannot cross (they differ in length or do not share
+    their middle letter).
+    """
+    size = len(diagonal)
+    if len(antidiagonal) != size:
+        return None
 
-        Returns a tuple of two booleans - the first being if a diagonal match was found
-        and the second being if an anti-diagonal match was found.
-        """
-        length = len(max(targets, key=len))
+    rows = [["?"] * size for _ in range(size)]
+    for idx in range(size):
+        rows[idx][idx] = diagonal[idx]
+        if rows[idx][size - idx - 1] not in ("?", antidiagonal[idx]):
+            return None
 
-        if y + length > self.height:
-            return (False, False)
+        rows[idx][size - idx - 1] = antidiagonal[idx]
 
-        diagonal = "".join(
-            self.cells[y + inc][x + inc : x + inc + 1] for inc in range(length)
-        )
-
-        antidiagonal = "".join(
-            self.cells[y + dy][x + dx - 1 : x + dx]
-            for dy, dx in zip(range(length), range(length, 0, -1))
-        )
-
-        return (diagonal.startswith(targets), antidiagonal.startswith(targets))
+    return ["".join(row) for row in rows]
 
 
 def get_word_frequency(lines: list[str], targets: tuple[str, ...]) -> int:
     """Searches ``targets`` in ``lines``. A target will be considered found if it appears
     horizontally, vertically, diagonally or anti-diagonally at any point in the grid."""
-    grid = Grid(lines)
-
-    word_count = 0
+    grid = FastGrid.from_lines(lines)
 
-    for y, x in product(range(grid.height), range(grid.width)):
-        word_count += sum(
-            (
-                grid.matches_horizontally(x, y, targets),
-                grid.matches_vertically(x, y, targets),
-                *grid.matches_diagonally(x, y, targets),
-            )
-        )
-
-    return word_count
+    return sum(grid.count_word(target, WORD_DIRECTIONS) for target in targets)
 
 
 def get_cross_frequency(lines: list[str], targets: tuple[str, ...]) -> int:
     """Searches ``targets`` in ``lines``. A target will be considered found if it appears
     both diagonally and anti-diagonally (forming a cross) at any point in the grid."""
-    grid = Grid(lines)
+    grid = FastGrid.from_lines(lines)
+
+    patterns = [
+        make_cross_pattern(diagonal, antidiagonal)
+        for diagonal, antidiagonal in product(targets, repeat=2)
+    ]
 
-    word_count = 0
+    return sum(grid.count_pattern(pattern) for pattern in patterns if pattern)
 
-    for y, x in product(range(grid.height), range(grid.width)):
-        diag, antidiag = grid.matches_diagonally(x, y, targets)
-        if diag and antidiag:
-            word_count += 1
 
-    return word_count
+def parse(puzzle: PuzzleInput) -> list[str]:
+    return list(puzzle)
+
+
+def part1(lines: list[str]) -> int:
+    return get_word_frequency(lines, FIRST_TARGETS)
+
+
+def part2(lines: list[str]) -> int:
+    return get_cross_frequency(lines, SECOND_TARGETS)
 
 
 if __name__ == "__main__":
     args = get_user_input(2024, 4)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
-
-    first_targets = ("XMAS", "SAMX")
-    second_targets = ("MAS", "SAM")
+    with args["input"] as puzzle:
+        lines = parse(puzzle)
 
     if args["part"] == 1:
-        print(
-            f"Times {first_targets} appear in input: {get_word_frequency(lines, first_targets)}"
-        )
+        print(f"Times {FIRST_TARGETS} appear in input: {part1(lines)}")
     elif args["part"] == 2:
-        print(
-            f"Times {second_targets} appear in input as crosses: {get_cross_frequency(lines, second_targets)}"
-        )
+        print(f"Times {SECOND_TARGETS} appear in input as crosses: {part2(lines)}")
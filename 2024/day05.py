@@ -6,7 +6,8 @@ https://adventofcode.com/2024/day/5
 from itertools import pairwise
 from typing import NamedTuple
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
+from aocutils import cached_parse
 
 
 class OrderRule(NamedTuple):
@@ -101,19 +102,30 @@ def get_incorrect_middle_update_sum(queue: PrintQueue) -> int:
     return middle_page_sum
 
 
+@cached_parse
+def parse(puzzle: PuzzleInput) -> PrintQueue:
+    return parse_print_queue(list(puzzle))
+
+
+def part1(queue: PrintQueue) -> int:
+    return get_correct_middle_update_sum(queue)
+
+
+def part2(queue: PrintQueue) -> int:
+    return get_incorrect_middle_update_sum(queue)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 5)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
-
-    queue = parse_print_queue(lines)
+    with args["input"] as puzzle:
+        queue = parse(puzzle)
 
     if args["part"] == 1:
         print(
-            f"Sum of middle elements of the correctly-ordered updates: {get_correct_middle_update_sum(queue)}"
+            f"Sum of middle elements of the correctly-ordered updates: {part1(queue)}"
         )
     elif args["part"] == 2:
         print(
-            f"Sum of middle elements of the incorrectly-ordered updates: {get_incorrect_middle_update_sum(queue)}"
+            f"Sum of middle elements of the incorrectly-ordered updates: {part2(queue)}"
         )
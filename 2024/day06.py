@@ -3,131 +3,149 @@ Advent of Code 2024 Day 6: Guard Gallivant
 https://adventofcode.com/2024/day/6
 """
 
-from collections import defaultdict
-from itertools import product
+import io
 
-from aocgen import get_user_input
-from aocutils import Point
+from aocgen import PuzzleInput, get_user_input
+from aocutils import Grid, MappedFile, Point, StateSet
 
-DIRECTIONS = {
-    "^": {"turn": ">", "move": Point(0, -1)},
-    ">": {"turn": "v", "move": Point(1, 0)},
-    "v": {"turn": "<", "move": Point(0, 1)},
-    "<": {"turn": "^", "move": Point(-1, 0)},
-}
+# the guard's symbols in clockwise order; when turning, the guard takes the next one
+DIRECTIONS = "^>v<"
+MOVES = (Point(0, -1), Point(1, 0), Point(0, 1), Point(-1, 0))
 
 OBSTACLE = "#"
-VISITED = "X"
 
 
 class GuardMap:
     """A grid of NxM length indicating the guard's map."""
 
-    def __init__(self, cells: list[list[str]]) -> None:
+    def __init__(self, grid: Grid, states: StateSet | None = None) -> None:
         """
         Arguments:
-            cells (list[list[str]]):
-                A list of rows representing the grid.
+            grid (Grid):
+                The grid representing the map.
 
-        """
-        self.cells = cells
-        self.width = len(self.cells[0])
-        self.height = len(self.cells)
+            states (StateSet, optional):
+                The set recording each (position, direction) the guard has been in.
+                Maps of the same size may share a set to avoid allocating one each.
 
-        self.position = self._find_guard_position()
-        self.visited = defaultdict[Point, int](int)
+        """
+        self.grid = grid
 
-    def _find_guard_position(self) -> Point:
-        for y, x in product(range(self.height), range(self.width)):
-            if self.cells[y][x] in DIRECTIONS:
-                return Point(x, y)
+        self.start, self.start_direction = self._find_guard()
+        if states is None:
+            states = StateSet(grid.stride * grid.height)
 
-        raise ValueError("No guard found in map.")
+        self.states = states
+        self.reset()
 
-    @property
-    def current(self) -> str:
-        """The value at the current cell."""
-        return self.cells[self.position.y][self.position.x]
+    def _find_guard(self) -> tuple[Point, int]:
+        for direction, symbol in enumerate(DIRECTIONS):
+            if (position := self.grid.find(symbol)) is not None:
+                return position, direction
 
-    @current.setter
-    def current(self, value: str) -> None:
-        self.cells[self.position.y][self.position.x] = value
+        raise ValueError("No guard found in map.")
 
-    def cell_at(self, point: Point) -> str:
-        """Returns the cell at ``point``."""
-        return self.cells[point.y][point.x]
+    def reset(self) -> None:
+        """Places the guard back in its starting position and forgets its states."""
+        self.position = self.start
+        self.direction = self.start_direction
 
-    def in_map(self, point: Point) -> bool:
-        """Checks whether ``point`` is still in the map."""
-        return 0 <= point.y < self.height and 0 <= point.x < self.width
+        self.states.clear()
+        self.states.add(self.grid.index(self.position), self.direction)
 
-    def step(self) -> bool:
-        """Moves one step in the current direction, turning if necessary.
+    def run(self) -> bool:
+        """Runs a simulation of the guard's movement. Returns whether the simulation resulted in a loop.
 
-        Returns whether the guard is still within the map.
+        The guard moves one step in its current direction, turning if an obstacle is in
+        the way. A loop happens once the guard is in a position and direction it has
+        already been in.
         """
-        symbol = self.current
-        direction = DIRECTIONS[symbol]
+        width, height, cells = self.grid.width, self.grid.height, self.grid.cells
+        stride = self.grid.stride
+        obstacle = ord(OBSTACLE)
 
-        next_pos = self.position + direction["move"]
-        if not self.in_map(next_pos):
-            self.visited[self.position] += 1
-            self.current = VISITED
-            return False
+        x, y = self.position
+        direction = self.direction
 
-        if self.cell_at(next_pos) == OBSTACLE:
-            self.current = direction["turn"]
-        else:
-            self.visited[self.position] += 1
-            self.current = VISITED
-            self.position = next_pos
-            self.current = symbol
+        while True:
+            dx, dy = MOVES[direction]
+            if not (0 <= x + dx < width and 0 <= y + dy < height):
+                looped = False
+                break
 
-        return True
+            if cells[(y + dy) * stride + x + dx] == obstacle:
+                direction = (direction + 1) % 4
+            else:
+                x, y = x + dx, y + dy
 
-    def run(self) -> bool:
-        """Runs a simulation of the guard's movement. Returns whether the simulation resulted in a loop."""
-        while self.step():
-            if self.visited[self.position] >= 4:
-                return True
+            if not self.states.add(y * stride + x, direction):
+                looped = True
+                break
 
-        return False
+        self.position = Point(x, y)
+        self.direction = direction
+        return looped
 
 
-def visit_positions(lines: list[str]) -> int:
+def visit_positions(grid: Grid) -> int:
     """Performs a simulation of the guard's movements and returns the amount of positions the guard visited."""
-    guard_map = GuardMap([list(line) for line in lines])
+    guard_map = GuardMap(grid)
     guard_map.run()
 
-    return len(guard_map.visited)
+    return guard_map.states.cell_count()
+
 
+def get_possible_loops(grid: Grid) -> int:
+    """Returns the amount of possible loops that a guard could be put into.
+
+    An obstacle can only change the guard's route if it is placed somewhere the guard
+    visits. Each candidate is tried on the same grid and state set, restoring the
+    cell afterwards.
+    """
+    guard_map = GuardMap(grid)
+    guard_map.run()
 
-def get_possible_loops(lines: list[str]) -> int:
-    """Returns the amount of possible loops that a guard could be put into."""
-    initial_map = GuardMap([list(line) for line in lines])
-    initial_map.run()
+    start = grid.index(guard_map.start)
+    candidates = [index for index in guard_map.states.cells() if index != start]
 
     loops = 0
-    for point in initial_map.visited:
-        checked_map = GuardMap([list(line) for line in lines])
-        if checked_map.cells[point.y][point.x] in DIRECTIONS:
-            continue
-
-        checked_map.cells[point.y][point.x] = OBSTACLE
-        looped = checked_map.run()
-        if looped:
+    for index in candidates:
+        previous = grid.cells[index]
+        grid.cells[index] = ord(OBSTACLE)
+
+        guard_map.reset()
+        if guard_map.run():
             loops += 1
 
+        grid.cells[index] = previous
+
     return loops
 
 
+def parse(puzzle: PuzzleInput) -> Grid:
+    """Maps the input file into a grid viewing it in place rather than copying it.
+    The map is copy-on-write, so obstacles placed in part 2 never reach the file."""
+    try:
+        return MappedFile(puzzle.fileno()).grid()
+    except io.UnsupportedOperation:  # the input is already in memory
+        return Grid.from_bytes(puzzle.bytes())
+
+
+def part1(grid: Grid) -> int:
+    return visit_positions(grid)
+
+
+def part2(grid: Grid) -> int:
+    return get_possible_loops(grid)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 6)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+    with args["input"] as puzzle:
+        grid = parse(puzzle)
 
     if args["part"] == 1:
-        print(f"Visited positions: {visit_positions(lines)}")
+        print(f"Visited positions: {part1(grid)}")
     elif args["part"] == 2:
-        print(f"Loops possible: {get_possible_loops(lines)}")
+        print(f"Loops possible: {part2(grid)}")
@@ -5,7 +5,7 @@ https://adventofcode.com/2024/day/7
 
 from dataclasses import dataclass
 
-from aocgen import get_user_input
+from aocgen import PuzzleInput, get_user_input
 
 
 @dataclass
@@ -91,15 +91,25 @@ def sum_calibration_results(lines: list[str], *, concat: bool) -> int:
     return true_sum
 
 
+def parse(puzzle: PuzzleInput) -> list[str]:
+    return list(puzzle)
+
+
+def part1(lines: list[str]) -> int:
+    return sum_calibration_results(lines, concat=False)
+
+
+def part2(lines: list[str]) -> int:
+    return sum_calibration_results(lines, concat=True)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 7)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+    with args["input"] as puzzle:
+        lines = parse(puzzle)
 
     if args["part"] == 1:
-        result = sum_calibration_results(lines, concat=False)
-        print(f"Total calibration result: {result}")
+        print(f"Total calibration result: {part1(lines)}")
     elif args["part"] == 2:
-        result = sum_calibration_results(lines, concat=True)
-        print(f"Total calibration result (with concat operator): {result}")
+        print(f"Total calibration result (with concat operator): {part2(lines)}")
@@ -7,8 +7,8 @@ import re
 from collections.abc import Generator
 from typing import NamedTuple
 
-from aocgen import get_user_input
-from aocutils import Point
+from aocgen import PuzzleInput, get_user_input
+from aocutils import Point, cached_parse
 
 
 class ClawMachine(NamedTuple):
@@ -102,29 +102,44 @@ def get_required_tokens(machine: ClawMachine) -> int | None:
         return (a_presses * A_TOKENS) + (b_presses * B_TOKENS)
 
 
+def get_total_tokens(machines: list[ClawMachine], prize_increment: int = 0) -> int:
+    """Gets the amount of tokens needed to get the prizes from all solvable claw
+    ``machines``, increasing the prize's X and Y by ``prize_increment``."""
+    increment = Point(prize_increment, prize_increment)
+
+    total = 0
+    for machine in machines:
+        tok = get_required_tokens(machine._replace(prize=machine.prize + increment))
+        if tok is not None:
+            total += tok
+
+    return total
+
+
+@cached_parse
+def parse(puzzle: PuzzleInput) -> list[ClawMachine]:
+    return list(parse_claw_machines(list(puzzle)))
+
+
+def part1(machines: list[ClawMachine]) -> int:
+    return get_total_tokens(machines)
+
+
+def part2(machines: list[ClawMachine]) -> int:
+    return get_total_tokens(machines, 10_000_000_000_000)
+
+
 if __name__ == "__main__":
     args = get_user_input(2024, 13)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+    with args["input"] as puzzle:
+        machines = parse(puzzle)
 
     if args["part"] == 1:
-        tokens = sum(
-            tok
-            for machine in parse_claw_machines(lines)
-            if (tok := get_required_tokens(machine)) is not None
-        )
-
         print(
-            f"Tokens needed to get the prizes from all solvable claw machines: {tokens}"
+            f"Tokens needed to get the prizes from all solvable claw machines: {part1(machines)}"
         )
     elif args["part"] == 2:
-        tokens = sum(
-            tok
-            for machine in parse_claw_machines(lines, 10_000_000_000_000)
-            if (tok := get_required_tokens(machine)) is not None
-        )
-
         print(
-            f"Tokens needed to get the prizes from all solvable claw machines (plus the offset): {tokens}"
+            f"Tokens needed to get the prizes from all solvable claw machines (plus the offset): {part2(machines)}"
         )
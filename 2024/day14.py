@@ -5,22 +5,24 @@ https://adventofcode.com/2024/day/14
 
 import re
 from functools import reduce
-from itertools import count
 from typing import NamedTuple
 
-from aocgen import get_user_input
-from aocutils import Point, wrap_point
+from aocgen import PuzzleInput, get_user_input
+from aocutils import PointArray, cached_parse
 
+# the size of the area and the steps taken in part 1, as given by the puzzle
+WIDTH, HEIGHT, STEPS = 101, 103, 100
 
-class Robot(NamedTuple):
-    position: Point
-    velocity: Point
 
+class Robots(NamedTuple):
+    positions: PointArray
+    velocities: PointArray
 
-def parse_robots(lines: list[str]) -> list[Robot]:
-    """Parses and returns a list of robots in an area."""
 
-    robots = []
+def parse_robots(lines: list[str]) -> Robots:
+    """Parses and returns the robots in an area."""
+
+    values: list[tuple[int, int, int, int]] = []
     for line in lines:
         mat = re.match(
             r"p=(?P<rx>-?\d+),(?P<ry>-?\d+) v=(?P<vx>-?\d+),(?P<vy>-?\d+)", line
@@ -28,98 +30,84 @@ def parse_robots(lines: list[str]) -> list[Robot]:
         if not mat:
             continue
 
-        robots.append(
-            Robot(
-                position=Point(x=int(mat.group("rx")), y=int(mat.group("ry"))),
-                velocity=Point(x=int(mat.group("vx")), y=int(mat.group("vy"))),
-            )
-        )
+        values.append((int(mat["rx"]), int(mat["ry"]), int(mat["vx"]), int(mat["vy"])))
 
-    return robots
+    rx, ry, vx, vy = zip(*values) if values else ((), (), (), ())
+    return Robots(positions=PointArray(rx, ry), velocities=PointArray(vx, vy))
 
 
-def step_robots(robots: list[Robot], width: int, height: int) -> None:
-    """Moves robots in-place by one step."""
+def step_robots(robots: Robots, width: int, height: int, steps: int = 1) -> None:
+    """Moves robots in-place by an amount of ``steps``."""
 
-    for idx, robot in enumerate(robots):
-        robots[idx] = Robot(
-            wrap_point(robot.position + robot.velocity, (0, width), (0, height)),
-            robot.velocity,
-        )
+    robots.positions.add(robots.velocities, steps).wrap(width, height)
 
 
-def get_safety_factor(robots: list[Robot], width: int, height: int, steps: int) -> int:
+def get_safety_factor(robots: Robots, width: int, height: int, steps: int) -> int:
     """Gets the safety factor for a group of ``robots`` given an area of ``width`` by
     ``height`` and moving the robots by an amount of ``steps``.
 
     The safety factor is the product of the amount of robots in each quadrant.
     """
 
-    for _ in range(steps):
-        step_robots(robots, width, height)
-
-    # quadrants normalized so up means negative and down means positive
-    quadrants = {"+x-y": [], "-x-y": [], "-x+y": [], "+x+y": []}
-    x_axis = width // 2
-    y_axis = height // 2
-
-    for robot in robots:
-        pos = robot.position
+    step_robots(robots, width, height, steps)
 
-        if pos.x > x_axis and pos.y < y_axis:
-            quadrants["+x-y"].append(robot)
-        elif pos.x < x_axis and pos.y < y_axis:
-            quadrants["-x-y"].append(robot)
-        elif pos.x < x_axis and pos.y > y_axis:
-            quadrants["-x+y"].append(robot)
-        elif pos.x > x_axis and pos.y > y_axis:
-            quadrants["+x+y"].append(robot)
+    quadrants = robots.positions.quadrant_counts(width, height)
+    return reduce(lambda x, y: x * y, quadrants)
 
-    return reduce(lambda x, y: x * y, [len(quad) for quad in quadrants.values()])
 
-
-def find_earliest_tree(robots: list[Robot], width: int, height: int) -> int:
+def find_earliest_tree(robots: Robots, width: int, height: int) -> int:
     """Finds the earliest 'Christmas Tree' picture formed by ``robots`` and in an
     area of ``width`` by ``height``.
 
     It is assumed that a picture is formed if a row of robots longer than 7 is found.
+    As the robots are back where they started after ``width * height`` steps, -1 is
+    returned if no picture is formed by then.
     """
 
-    for loop in count(1):
-        grid = [list("." * width) for _ in range(height)]
+    row_of_robots = b"\x01" * 8
+
+    for loop in range(1, width * height + 1):
         step_robots(robots, width, height)
-        for robot in robots:
-            grid[robot.position.y][robot.position.x] = "#"
+        occupied = robots.positions.occupancy(width, height)
 
-        for robot in robots:
-            if "".join(grid[robot.position.y][robot.position.x :]).startswith("#" * 8):
+        for y in range(height):
+            if row_of_robots in occupied[y * width : (y + 1) * width]:
                 return loop
 
-    return -1  # this won't be reached, but pyright complains anyways
+    return -1
+
+
+@cached_parse
+def parse(puzzle: PuzzleInput) -> Robots:
+    return parse_robots(list(puzzle))
+
+
+def part1(robots: Robots, width: int = WIDTH, height: int = HEIGHT) -> int:
+    return get_safety_factor(robots, width, height, STEPS)
+
+
+def part2(robots: Robots, width: int = WIDTH, height: int = HEIGHT) -> int:
+    return find_earliest_tree(robots, width, height)
 
 
 if __name__ == "__main__":
     args = get_user_input(2024, 14)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+    with args["input"] as puzzle:
+        robots = parse(puzzle)
 
     print("Leave the following fields empty to use defaults.")
     width = input("Width: ").strip()
     height = input("Height: ").strip()
     steps = input("Steps (part 1 only): ").strip()
 
-    width = int(width) if width else 101
-    height = int(height) if height else 103
-    steps = int(steps) if steps else 100
+    width = int(width) if width else WIDTH
+    height = int(height) if height else HEIGHT
+    steps = int(steps) if steps else STEPS
 
     if args["part"] == 1:
-        robots = parse_robots(lines)
-
         factor = get_safety_factor(robots, width, height, steps)
         print(f"The safety factor after {steps} step(s) is {factor}")
     elif args["part"] == 2:
-        robots = parse_robots(lines)
-
         tree_steps = find_earliest_tree(robots, width, height)
         print(f"The earliest christmas tree can be found in {tree_steps} step(s).")
@@ -1,45 +1,88 @@
 import argparse
+import atexit
+import importlib
 import os
-from io import TextIOWrapper
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
 
-import requests
+from .puzzleinput import PuzzleInput
 
 __version__ = "0.1.0"
 
+PROFILE_MODES = ("cpu", "alloc")
+
+# names provided by modules with costly imports, which are only imported on access
+_LAZY_ATTRIBUTES = {"InputFetchError": "fetch", "get_puzzle_input": "fetch"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class Arguments(TypedDict):
     input_file: TextIOWrapper
+    input: PuzzleInput
+    """A streaming view of ``input_file``."""
     part: int
 
 
-class InputFetchError(Exception):
-    pass
-
-
 def load_session_token(fallback: Path | None = None) -> str | None:
-    session_token = os.environ.get("AOC_SESSION_TOKEN")
+    """Gets the session token from ``AOC_SESSION_TOKEN`` or else from the
+    ``fallback`` file (``TOKEN`` by default), without surrounding whitespace."""
+    session_token = os.environ.get("AOC_SESSION_TOKEN", "").strip()
     if session_token:
         return session_token
 
     fallback = fallback or Path("TOKEN")
     if fallback.exists():
-        return fallback.read_text()
+        return fallback.read_text().strip() or None
 
 
-def get_puzzle_input(year: int, day: int, session_token: str) -> str:
-    aoc_rs = requests.get(
-        f"https://adventofcode.com/{year}/day/{day}/input",
-        cookies={"session": session_token},
-        headers={"User-Agent": "aescarias/aocgen (contact=lotta.dev@outlook.com)"},
-    )
-    if not aoc_rs.ok:
-        raise InputFetchError(
-            f"Could not fetch input due to {aoc_rs.status_code} {aoc_rs.reason}: {aoc_rs.text!r}"
-        )
+def get_input_path(year: int, day: int) -> Path:
+    """Gets the path where the puzzle input for ``year`` and ``day`` is stored."""
+    return Path("inputs") / str(year) / f"day{day:02d}_input.txt"
+
+
+def read_input(year: int, day: int, path: Path | None = None) -> bytes:
+    """Reads the puzzle input for ``year`` and ``day`` from ``path`` if given, or
+    else from its input file, falling back to the input archive (found at
+    ``AOC_ARCHIVE`` if set)."""
+    if path is not None:
+        return path.read_bytes()
+
+    path = get_input_path(year, day)
+    if path.exists():
+        return path.read_bytes()
 
-    return aoc_rs.text
+    from .archive import InputArchive
+
+    archive = InputArchive()
+    try:
+        return archive.read(year, day)
+    except KeyError:
+        raise FileNotFoundError(
+            f"No input found at {path} or in {archive.path}"
+        ) from None
+
+
+def has_input(year: int, day: int) -> bool:
+    """Checks whether there is an input for ``year`` and ``day``, either as a file
+    or in the input archive."""
+    if get_input_path(year, day).exists():
+        return True
+
+    from .archive import InputArchive, get_archive_path, get_entry_key
+
+    archive_path = get_archive_path()
+    if not archive_path.exists():
+        return False
+
+    return get_entry_key(year, day) in InputArchive(archive_path)
 
 
 def get_user_input(year: int, day: int) -> Arguments:
@@ -51,9 +94,45 @@ def get_user_input(year: int, day: int) -> Arguments:
         "--input",
         "-I",
         type=argparse.FileType("r"),
-        default=f"inputs/{year}/day{day:02d}_input.txt",
+        default=None,
+        help="defaults to the input file for the day, or else the input archive",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cpu",
+        choices=PROFILE_MODES,
+        help="profile the solution for CPU time (default) or memory allocations",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="number of entries in profile reports"
     )
 
     args = parser.parse_args()
 
-    return {"input_file": args.input, "part": args.part}
+    if args.input is None:
+        input_path = get_input_path(year, day)
+        try:
+            if input_path.exists():
+                args.input = input_path.open()
+            else:
+                args.input = TextIOWrapper(BytesIO(read_input(year, day)))
+        except OSError as exc:
+            parser.error(str(exc))
+
+    if args.profile:
+        from .profiling import ProfileSession, get_dump_path
+
+        # the solution runs after we return, so it is profiled until the program exits
+        session = ProfileSession(
+            args.profile, args.top, get_dump_path(year, day, args.part)
+        )
+        session.start()
+        atexit.register(session.finish)
+
+    return {
+        "input_file": args.input,
+        "input": PuzzleInput(args.input.buffer),
+        "part": args.part,
+    }
@@ -1,9 +1,11 @@
 import argparse
 import getpass
+import importlib
 import pathlib
 import string
+import sys
 
-from . import InputFetchError, get_puzzle_input, load_session_token
+from . import get_input_path, load_session_token
 
 
 class Style:
@@ -16,27 +18,79 @@ class Style:
     YELLOW = "\x1b[33m"
 
 
-AOC_TEMPLATE = """\"\"\"
+SOLUTION_TEMPLATE = """\"\"\"
 Advent of Code $year Day $day: $title
 https://adventofcode.com/$year/day/$day
 \"\"\"
 
-from aocgen import get_user_input
+import random
+from collections.abc import Iterator
 
-# solution here
+from aocgen import PuzzleInput
+from aocgen.solution import register
+$imports
+Data = $data_type
 
-if __name__ == "__main__":
-    args = get_user_input($year, $day)
 
-    with args["input_file"] as fp:
-        lines = fp.read().splitlines()
+def parse(puzzle: PuzzleInput) -> Data:
+    $parse
+
+
+def part1(data: Data) -> int:
+    # first part solution
+    ...
+
+
+def part2(data: Data) -> int:
+    # second part solution
+    ...
+
 
-    if args["part"] == 1:
-        ...  # first part solution
-    elif args["part"] == 2:
-        ...  # second part solution
+def generate(rng: random.Random, size: int) -> Iterator[str]:
+    \"\"\"Yields the lines of a synthetic input for scaling tests.\"\"\"
+    $generate
+
+
+$register
+
+if __name__ == "__main__":
+    solution.main()
 """
 
+# the parts of the solution template that differ depending on the shape of the input
+TEMPLATE_VARIANTS = {
+    "default": {
+        "imports": "",
+        "data_type": "list[str]",
+        "parse": "return list(puzzle)",
+        "generate": (
+            "for _ in range(size):\n"
+            '        yield "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=20))'
+        ),
+        "size_unit": "lines",
+    },
+    "grid": {
+        "imports": "from aocutils import Grid\n",
+        "data_type": "Grid",
+        "parse": "return Grid.from_bytes(puzzle.bytes())",
+        "generate": (
+            "for _ in range(size):\n"
+            '        yield "".join(rng.choices(".#", weights=(9, 1), k=size))'
+        ),
+        "size_unit": "columns and rows",
+    },
+    "columns": {
+        "imports": "",
+        "data_type": "list[tuple[int, ...]]",
+        "parse": "return list(puzzle.ints())",
+        "generate": (
+            "for _ in range(size):\n"
+            '        yield f"{rng.randint(1, 99999)}   {rng.randint(1, 99999)}"'
+        ),
+        "size_unit": "lines",
+    },
+}
+
 
 SESSION_TOKEN_MESSAGE = (
     f"{Style.RED}No session token provided.{Style.RESET}\n"
@@ -55,9 +109,29 @@ SESSION_TOKEN_MESSAGE = (
 )
 
 
-def write_solution(year: int, day: int, title: str) -> bool:
-    template = string.Template(AOC_TEMPLATE)
-    output = template.substitute(year=year, day=day, title=title)
+def format_register(year: int, day: int, size_unit: str) -> str:
+    """Formats the call registering the solution as black would, on one line if it
+    fits."""
+    arguments = (
+        f'{year}, {day}, parse, part1, part2, generate, size_unit="{size_unit}"'
+    )
+    line = f"solution = register({arguments})"
+    if len(line) <= 88:
+        return line
+
+    return f"solution = register(\n    {arguments}\n)"
+
+
+def write_solution(year: int, day: int, title: str, variant: str = "default") -> bool:
+    template = string.Template(SOLUTION_TEMPLATE)
+    variables = TEMPLATE_VARIANTS[variant]
+    output = template.substitute(
+        variables,
+        year=year,
+        day=day,
+        title=title,
+        register=format_register(year, day, variables["size_unit"]),
+    )
 
     output_path = pathlib.Path(str(year)) / f"day{day:02d}.py"
     output_path.parent.mkdir(exist_ok=True)
@@ -78,7 +152,9 @@ def confirm(prompt: str) -> bool:
 
 
 def write_input(year: int, day: int, key: str) -> tuple[bool, str]:
-    puzzle_input_path = pathlib.Path("inputs") / str(year) / f"day{day:02d}_input.txt"
+    from .fetch import InputFetchError, get_puzzle_input
+
+    puzzle_input_path = get_input_path(year, day)
     puzzle_input_path.parent.mkdir(parents=True, exist_ok=True)
 
     if puzzle_input_path.exists():
@@ -121,7 +197,7 @@ def write_input(year: int, day: int, key: str) -> tuple[bool, str]:
         return (False, "ERROR")
 
 
-def run_setup_cli() -> None:
+def run_setup_cli(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         prog="aocgen", description="Create a template for your Advent of Code solution."
     )
@@ -130,10 +206,16 @@ def run_setup_cli() -> None:
     parser.add_argument("day", type=int)
     parser.add_argument("-T", "--title", type=str, required=False, default="[untitled]")
     parser.add_argument("-K", "--key", type=str, required=False, default="TOKEN")
+    parser.add_argument(
+        "--template",
+        choices=TEMPLATE_VARIANTS,
+        default="default",
+        help="the shape of the input the solution is written for",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    solution_written = write_solution(args.year, args.day, args.title)
+    solution_written = write_solution(args.year, args.day, args.title, args.template)
     if solution_written:
         print(f"{Style.GREEN}Solution file was written successfully.{Style.RESET}")
     else:
@@ -154,5 +236,28 @@ def run_setup_cli() -> None:
         )
 
 
+# maps each subcommand to the module implementing it, imported only when it is used
+COMMANDS = {
+    "run": "runner",
+    "bench": "bench",
+    "fetch": "download",
+    "gen": "gen",
+    "serve": "daemon",
+    "archive": "archive",
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Dispatches to a subcommand such as ``aocgen run``, falling back to the setup
+    CLI (``aocgen YEAR DAY``) if no subcommand is given."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] in COMMANDS:
+        module = importlib.import_module(f".{COMMANDS[argv[0]]}", __package__)
+        module.run_cli(argv[1:])
+    else:
+        run_setup_cli(argv)
+
+
 if __name__ == "__main__":
-    run_setup_cli()
+    main()
@@ -0,0 +1,70 @@
+"""Stores the answers of solutions so that unchanged parts need not be run again.
+
+Answers are keyed by the part along with the SHA-256 digests of the solution's
+source and of the input it was run against, so an answer is only reused for the
+exact solution and input that produced it.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .history import result_key
+
+DEFAULT_ANSWERS_PATH = Path(".aocgen") / "answers.json"
+
+
+def get_answer_key(year: int, day: int, part: int, source: bytes, data: bytes) -> str:
+    """Gets the key of the answer to a part given the ``source`` of its solution and
+    the input ``data``."""
+    source_digest = hashlib.sha256(source).hexdigest()
+    input_digest = hashlib.sha256(data).hexdigest()
+
+    return f"{result_key(year, day, part)}/{source_digest}/{input_digest}"
+
+
+class AnswerStore:
+    """The answers recorded in a JSON file, mapping answer keys to answers.
+
+    Answers are kept as strings, the way they are printed. Changes are only
+    written back to the file by :meth:`save`.
+    """
+
+    def __init__(self, path: Path = DEFAULT_ANSWERS_PATH) -> None:
+        self.path = path
+        self.answers: dict[str, str] = {}
+        self.modified = False
+
+        if path.exists():
+            self.answers = json.loads(path.read_text())["answers"]
+
+    def get(self, key: str) -> str | None:
+        return self.answers.get(key)
+
+    def record(self, key: str, answer: object) -> str | None:
+        """Records ``answer`` under ``key``.
+
+        If a different answer was already stored, it is kept and returned instead
+        so that the caller can report the mismatch.
+        """
+        stored = self.answers.get(key)
+        if stored is not None and stored != str(answer):
+            return stored
+
+        if stored is None:
+            self.answers[key] = str(answer)
+            self.modified = True
+
+        return None
+
+    def save(self) -> None:
+        if not self.modified:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"answers": self.answers}, indent=2))
+        os.replace(temp_path, self.path)
+        self.modified = False
@@ -0,0 +1,227 @@
+"""Stores puzzle inputs in a single compressed, content-addressed archive.
+
+The archive is a zip file holding each distinct input once as ``objects/<sha256>``,
+along with an ``index.json`` mapping ``account/year/day`` to the digest of its
+input. Identical inputs (across accounts, or duplicated by mistake) are stored
+once, and each input is checked against its digest when read.
+
+Entries are read directly from the archive. Changes are made by writing a new
+archive next to the old one and replacing it, so readers never see a partial one.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import tempfile
+import zipfile
+from collections.abc import Iterator, Mapping
+from contextlib import ExitStack
+from pathlib import Path
+
+DEFAULT_ARCHIVE_PATH = Path("inputs") / "inputs.zip"
+DEFAULT_ACCOUNT = "default"
+
+_INDEX_NAME = "index.json"
+_INPUT_PATTERN = re.compile(r"day(\d{2})_input\.txt")
+
+
+class ArchiveError(OSError):
+    pass
+
+
+def get_archive_path() -> Path:
+    """Gets the path of the input archive, set by ``AOC_ARCHIVE``."""
+    archive_path = os.environ.get("AOC_ARCHIVE")
+    return Path(archive_path) if archive_path else DEFAULT_ARCHIVE_PATH
+
+
+def get_account() -> str:
+    """Gets the account whose inputs are used, set by ``AOC_ACCOUNT``."""
+    return os.environ.get("AOC_ACCOUNT") or DEFAULT_ACCOUNT
+
+
+def get_entry_key(year: int, day: int, account: str | None = None) -> str:
+    return f"{account or get_account()}/{year}/{day:02d}"
+
+
+def _get_object_name(digest: str) -> str:
+    return f"objects/{digest}"
+
+
+class InputArchive:
+    """The inputs stored in the archive at ``path``, which may not exist yet (see
+    :func:`get_archive_path` for the default)."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        path = path or get_archive_path()
+        self.path = path
+        self.index: dict[str, str] = {}
+
+        if path.exists():
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    self.index = json.loads(archive.read(_INDEX_NAME))["inputs"]
+            except (zipfile.BadZipFile, KeyError, ValueError) as exc:
+                raise ArchiveError(f"Invalid input archive at {path}: {exc}") from exc
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def read(self, year: int, day: int, account: str | None = None) -> bytes:
+        """Reads the input for ``year`` and ``day`` of ``account`` (see
+        :func:`get_account`), raising :class:`KeyError` if it is not archived."""
+        key = get_entry_key(year, day, account)
+        digest = self.index[key]
+
+        with zipfile.ZipFile(self.path) as archive:
+            data = archive.read(_get_object_name(digest))
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ArchiveError(f"Input {key} does not match its digest")
+
+        return data
+
+    def verify(self) -> Iterator[str]:
+        """Yields the keys of the entries whose input is missing or corrupted."""
+        with zipfile.ZipFile(self.path) as archive:
+            names = set(archive.namelist())
+
+            for key, digest in self.index.items():
+                name = _get_object_name(digest)
+                if name not in names:
+                    yield key
+                elif hashlib.sha256(archive.read(name)).hexdigest() != digest:
+                    yield key
+
+    def update(self, inputs: Mapping[str, bytes]) -> int:
+        """Stores ``inputs`` (keyed by :func:`get_entry_key`) in the archive,
+        returning the number of new objects written.
+
+        Objects no longer referenced by any entry are dropped.
+        """
+        index = dict(self.index)
+        stored = set(self.index.values())
+        new_objects: dict[str, bytes] = {}
+
+        for key, data in inputs.items():
+            digest = hashlib.sha256(data).hexdigest()
+            index[key] = digest
+            if digest not in stored:
+                new_objects[digest] = data
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+
+        try:
+            with ExitStack() as stack:
+                output = stack.enter_context(
+                    zipfile.ZipFile(
+                        stack.enter_context(os.fdopen(fd, "wb")),
+                        "w",
+                        zipfile.ZIP_DEFLATED,
+                        compresslevel=9,
+                    )
+                )
+                if stored:
+                    archive = stack.enter_context(zipfile.ZipFile(self.path))
+
+                for digest in sorted(set(index.values())):
+                    name = _get_object_name(digest)
+                    if digest in new_objects:
+                        output.writestr(name, new_objects[digest])
+                    else:
+                        output.writestr(name, archive.read(name))
+
+                output.writestr(
+                    _INDEX_NAME, json.dumps({"inputs": dict(sorted(index.items()))})
+                )
+
+            os.replace(temp_name, self.path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+        self.index = index
+        return len(new_objects)
+
+
+def find_input_files(root: Path = Path("inputs")) -> Iterator[tuple[int, int, Path]]:
+    """Finds the input files stored as ``<root>/<year>/day<NN>_input.txt``."""
+    for path in sorted(root.glob("*/day*_input.txt")):
+        match = _INPUT_PATTERN.fullmatch(path.name)
+        if match and path.parent.name.isdigit():
+            yield int(path.parent.name), int(match[1]), path
+
+
+def run_cli(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="aocgen archive",
+        description="Manage the archive of puzzle inputs.",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help=f"the archive to manage (AOC_ARCHIVE or {str(DEFAULT_ARCHIVE_PATH)!r})",
+    )
+    parser.add_argument(
+        "--account",
+        default=None,
+        help=f"the account the inputs belong to (AOC_ACCOUNT or {DEFAULT_ACCOUNT!r})",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = commands.add_parser("pack", help="add input files to the archive")
+    pack_parser.add_argument("years", type=int, nargs="*")
+    pack_parser.add_argument(
+        "--remove", action="store_true", help="delete input files once archived"
+    )
+    commands.add_parser("list", help="list the archived inputs")
+    commands.add_parser("verify", help="check the archived inputs against digests")
+
+    args = parser.parse_args(argv)
+    args.archive = args.archive or get_archive_path()
+
+    try:
+        archive = InputArchive(args.archive)
+    except ArchiveError as exc:
+        parser.exit(1, f"E: {exc}\n")
+
+    if args.command == "pack":
+        files = [
+            (year, day, path)
+            for year, day, path in find_input_files()
+            if not args.years or year in args.years
+        ]
+        inputs = {
+            get_entry_key(year, day, args.account): path.read_bytes()
+            for year, day, path in files
+        }
+
+        written = archive.update(inputs)
+        print(
+            f"Archived {len(inputs)} input(s) to {args.archive} "
+            f"({written} not stored before)"
+        )
+
+        if args.remove:
+            for _, _, path in files:
+                path.unlink()
+    elif args.command == "list":
+        for key, digest in archive.index.items():
+            print(f"{key}  {digest[:16]}")
+        unique = len(set(archive.index.values()))
+        print(f"{len(archive.index)} input(s), {unique} unique")
+    else:
+        corrupted = list(archive.verify()) if archive.path.exists() else []
+        for key in corrupted:
+            print(f"CORRUPTED {key}")
+
+        if corrupted:
+            parser.exit(1)
+        print(f"All {len(archive.index)} input(s) match their digests.")
@@ -0,0 +1,295 @@
+"""Benchmarks solutions and keeps a history of the results.
+
+Each run is stored in a JSON history file under the git commit it was taken at.
+Results are keyed by ``year/day/part`` and record a hash of the input they were
+measured against, so that only measurements on the same input get compared.
+"""
+
+import argparse
+import hashlib
+import math
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from . import has_input, read_input
+from .history import DEFAULT_HISTORY_PATH, load_history, result_key, save_history
+from .memory import MemoryLimitError, format_bytes, measure_memory, parse_size
+from .runner import (
+    PARTS,
+    SolutionError,
+    discover_solutions,
+    format_duration,
+    load_solution,
+    run_part,
+)
+
+
+class Measurement(NamedTuple):
+    input_hash: str
+    repeat: int
+    min_ns: int
+    median_ns: int
+    p95_ns: int
+    peak_bytes: int
+    max_rss_bytes: int | None
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    """The field of the result that regressed, ``median_ns`` or ``peak_bytes``."""
+    base: int
+    current: int
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.base
+
+    def format_value(self, value: int) -> str:
+        if self.metric == "peak_bytes":
+            return format_bytes(value)
+
+        return format_duration(value)
+
+
+def hash_input(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def get_git_commit() -> str:
+    """Gets the abbreviated hash of the current git commit, suffixed with ``-dirty``
+    if the working tree has uncommitted changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{commit}-dirty" if status.strip() else commit
+
+
+def percentile(values: list[int], pct: float) -> int:
+    """Gets the ``pct``-th percentile of ``values`` using the nearest-rank method."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def parse_count(value: str) -> int:
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count: {value!r}") from None
+
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"count must be at least 1: {value!r}")
+
+    return count
+
+
+def measure(
+    module: Any, part: int, data: bytes, repeat: int = 5, warmup: int = 1
+) -> list[int]:
+    """Times ``repeat`` runs of ``part`` after ``warmup`` untimed runs, returning
+    the wall time of each run in nanoseconds."""
+    for _ in range(warmup):
+        run_part(module, part, data)
+
+    return [run_part(module, part, data).total_ns for _ in range(repeat)]
+
+
+def bench_solution(
+    year: int,
+    day: int,
+    parts: tuple[int, ...] = PARTS,
+    repeat: int = 5,
+    warmup: int = 1,
+    input_path: Path | None = None,
+    memory_limit: int | None = None,
+) -> dict[int, Measurement]:
+    """Benchmarks the specified ``parts`` of the solution for ``year`` and ``day``.
+
+    Memory usage is measured first in a separate run (see :func:`measure_memory`),
+    so that a part exceeding ``memory_limit`` raises :class:`MemoryLimitError`
+    before it is timed.
+    """
+    module = load_solution(year, day)
+    data = read_input(year, day, input_path)
+    input_hash = hash_input(data)
+
+    results = {}
+    for part in parts:
+        usage = measure_memory(year, day, part, data, top=0, limit=memory_limit)
+        times = measure(module, part, data, repeat, warmup)
+        results[part] = Measurement(
+            input_hash,
+            repeat,
+            min(times),
+            int(statistics.median(times)),
+            percentile(times, 95),
+            usage.peak_bytes,
+            usage.max_rss_bytes,
+        )
+
+    return results
+
+
+def find_baseline(
+    runs: list[dict[str, Any]], commit: str | None, exclude: str
+) -> dict[str, Any] | None:
+    """Finds the most recent run taken at ``commit``, or if no commit is given, the
+    most recent run not taken at ``exclude``."""
+    for run in reversed(runs):
+        if commit is not None and run["commit"].startswith(commit):
+            return run
+        elif commit is None and run["commit"] != exclude:
+            return run
+
+
+def compare_results(
+    base: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float = 0.1,
+) -> list[Regression]:
+    """Finds the results in ``current`` whose median time or peak memory exceeds
+    the one in ``base`` by more than ``threshold`` (a fraction).
+
+    Results measured against different inputs are not compared.
+    """
+    regressions = []
+
+    for key, result in current.items():
+        base_result = base.get(key)
+        if base_result is None or base_result["input_hash"] != result["input_hash"]:
+            continue
+
+        for metric in ("median_ns", "peak_bytes"):
+            if result[metric] > base_result[metric] * (1 + threshold):
+                regressions.append(
+                    Regression(key, metric, base_result[metric], result[metric])
+                )
+
+    return regressions
+
+
+def run_cli(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="aocgen bench",
+        description="Benchmark Advent of Code solutions and detect regressions.",
+    )
+
+    parser.add_argument("year", type=int, nargs="?")
+    parser.add_argument("day", type=int, nargs="?")
+    parser.add_argument("-n", "--repeat", type=parse_count, default=5)
+    parser.add_argument("-w", "--warmup", type=int, default=1)
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH)
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="COMMIT",
+        help="compare against COMMIT (or the latest run from another commit)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="growth in time or memory (as a fraction) counted as a regression",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=parse_size,
+        default=None,
+        metavar="SIZE",
+        help="skip parts using more than SIZE of address space (e.g. 512M or 2G)",
+    )
+    parser.add_argument("--no-save", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    solutions = [
+        (year, day)
+        for year, day in discover_solutions()
+        if args.year in (None, year) and args.day in (None, day)
+    ]
+
+    commit = get_git_commit()
+    results: dict[str, dict[str, Any]] = {}
+    failed = False
+
+    for year, day in solutions:
+        if not has_input(year, day):
+            print(f"{year} day {day:>2}: skipped (no input)")
+            continue
+
+        try:
+            measurements = bench_solution(
+                year, day, PARTS, args.repeat, args.warmup, None, args.memory_limit
+            )
+        except (SolutionError, MemoryLimitError) as exc:
+            print(f"{year} day {day:>2}: skipped ({exc})")
+            continue
+        except Exception as exc:
+            # raised by the solution, or a process measuring it died
+            print(f"{year} day {day:>2}: failed ({type(exc).__name__}: {exc})")
+            failed = True
+            continue
+
+        for part, result in measurements.items():
+            results[result_key(year, day, part)] = result._asdict()
+            print(
+                f"{year} day {day:>2} part {part}: "
+                f"min {format_duration(result.min_ns):>10}  "
+                f"median {format_duration(result.median_ns):>10}  "
+                f"p95 {format_duration(result.p95_ns):>10}  "
+                f"peak {format_bytes(result.peak_bytes):>10}  "
+                f"max RSS {format_bytes(result.max_rss_bytes or 0):>10}"
+            )
+
+    runs = load_history(args.history)
+
+    regressions = []
+    if args.compare is not None:
+        baseline = find_baseline(runs, args.compare or None, commit)
+        if baseline is None:
+            print("No baseline run found to compare against.")
+        else:
+            regressions = compare_results(
+                baseline["results"], results, args.threshold
+            )
+            print(f"Compared against {baseline['commit']}:")
+            for regression in regressions:
+                print(
+                    f"  REGRESSION {regression.key} ({regression.metric}): "
+                    f"{regression.format_value(regression.base)} -> "
+                    f"{regression.format_value(regression.current)} "
+                    f"({regression.ratio:.2f}x)"
+                )
+            if not regressions:
+                print("  No regressions found.")
+
+    if not args.no_save and results:
+        runs.append(
+            {
+                "commit": commit,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "results": results,
+            }
+        )
+        save_history(args.history, runs)
+
+    if regressions or failed:
+        parser.exit(1)
@@ -0,0 +1,219 @@
+"""A daemon that keeps solutions and inputs loaded between runs.
+
+The daemon listens on a Unix socket for requests to run a solution, which are
+sent by ``aocgen run --daemon``. As the interpreter stays alive, imports (such as
+``aocutils``) and input files are only loaded once; solution modules are reloaded
+when their file changes, and inputs are read again when theirs do. Changes to
+modules other than the solutions themselves require restarting the daemon.
+
+Requests and responses are single lines of JSON.
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from . import get_input_path, read_input
+from .archive import get_archive_path
+from .runner import (
+    PARTS,
+    PartResult,
+    SolutionError,
+    format_duration,
+    format_result,
+    get_solution_path,
+    load_solution,
+    run_part,
+)
+
+DEFAULT_SOCKET_PATH = Path(".aocgen") / "daemon.sock"
+
+
+class DaemonError(Exception):
+    pass
+
+
+class WarmCache:
+    """Solution modules and inputs, reloaded only when their file changes."""
+
+    def __init__(self) -> None:
+        self.modules: dict[tuple[int, int], tuple[int, ModuleType]] = {}
+        self.inputs: dict[tuple[Path, int, int], tuple[int, bytes]] = {}
+
+    def get_module(self, year: int, day: int) -> tuple[ModuleType, bool]:
+        """Gets the solution for ``year`` and ``day``, along with whether it had to
+        be loaded."""
+        mtime = get_solution_path(year, day).stat().st_mtime_ns
+
+        cached = self.modules.get((year, day))
+        if cached is not None and cached[0] == mtime:
+            return cached[1], False
+
+        module = load_solution(year, day)
+        self.modules[(year, day)] = (mtime, module)
+        return module, True
+
+    def get_input(self, year: int, day: int, path: Path | None = None) -> bytes:
+        """Gets the input from ``path``, or else from its input file or the input
+        archive (see :func:`read_input`)."""
+        source = path or get_input_path(year, day)
+        if path is None and not source.exists():
+            source = get_archive_path()
+
+        mtime = source.stat().st_mtime_ns
+
+        cached = self.inputs.get((source, year, day))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        data = read_input(year, day, path)
+        self.inputs[(source, year, day)] = (mtime, data)
+        return data
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path) -> None:
+        self.cache = WarmCache()
+        super().__init__(str(socket_path), DaemonHandler)
+
+    def run(self, request: dict[str, Any]) -> dict[str, Any]:
+        year, day = request["year"], request["day"]
+        input_path = Path(request["input"]) if request.get("input") else None
+
+        module, loaded = self.cache.get_module(year, day)
+        data = self.cache.get_input(year, day, input_path)
+
+        results = [run_part(module, part, data) for part in request["parts"]]
+        return {
+            "loaded": loaded,
+            "results": [
+                {**result._asdict(), "answer": str(result.answer)} for result in results
+            ],
+        }
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+
+        if request.get("command") == "stop":
+            response: dict[str, Any] = {"stopped": True}
+            # shutdown() waits for serve_forever() to return, which is blocked on
+            # this handler, so it has to be called from another thread
+            threading.Thread(target=self.server.shutdown).start()
+        elif request.get("command") == "ping":
+            response = {"pid": os.getpid()}
+        else:
+            try:
+                response = self.server.run(request)
+            except (SolutionError, OSError) as exc:
+                response = {"error": str(exc)}
+            except Exception:
+                response = {"error": traceback.format_exc()}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def send_request(
+    request: dict[str, Any], socket_path: Path = DEFAULT_SOCKET_PATH
+) -> dict[str, Any]:
+    """Sends ``request`` to the daemon and returns its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise DaemonError(
+                f"Could not connect to the daemon at {socket_path} "
+                "(start it with 'aocgen serve')"
+            ) from exc
+
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as fp:
+            return json.loads(fp.readline())
+
+
+def run_with_daemon(
+    year: int,
+    day: int,
+    parts: tuple[int, ...] = PARTS,
+    input_path: Path | None = None,
+    socket_path: Path = DEFAULT_SOCKET_PATH,
+) -> None:
+    """Runs a solution in the daemon and prints its results."""
+    # the daemon may have been started from another directory
+    if input_path is not None:
+        input_path = input_path.resolve()
+
+    start = time.perf_counter_ns()
+    response = send_request(
+        {
+            "year": year,
+            "day": day,
+            "parts": list(parts),
+            "input": str(input_path) if input_path else None,
+        },
+        socket_path,
+    )
+    elapsed = time.perf_counter_ns() - start
+
+    if "error" in response:
+        raise DaemonError(response["error"].rstrip())
+
+    loaded = " (loaded)" if response["loaded"] else ""
+    print(f"{year} day {day}{loaded}")
+    for result in response["results"]:
+        print(f"  part {result['part']}: {format_result(PartResult(**result))}")
+    print(f"Round trip: {format_duration(elapsed)}")
+
+
+def serve(socket_path: Path = DEFAULT_SOCKET_PATH) -> None:
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        try:
+            send_request({"command": "ping"}, socket_path)
+        except (DaemonError, OSError):
+            socket_path.unlink()  # left behind by a daemon that did not exit cleanly
+        else:
+            raise DaemonError(f"A daemon is already listening on {socket_path}")
+
+    with DaemonServer(socket_path) as server:
+        print(f"Listening on {socket_path} (pid {os.getpid()})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def run_cli(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="aocgen serve",
+        description="Keep solutions and inputs loaded to run them with low latency.",
+    )
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    parser.add_argument("--stop", action="store_true", help="stop a running daemon")
+
+    args = parser.parse_args(argv)
+
+    if not hasattr(socket, "AF_UNIX"):
+        parser.exit(1, "E: The daemon requires Unix domain sockets.\n")
+
+    try:
+        if args.stop:
+            send_request({"command": "stop"}, args.socket)
+            print("Daemon stopped.")
+        else:
+            serve(args.socket)
+    except DaemonError as exc:
+        parser.exit(1, f"E: {exc}\n")
@@ -0,0 +1,191 @@
+"""Downloads the inputs of many days concurrently."""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from . import get_input_path, load_session_token
+from .fetch import InputFetchError, ResponseCache, fetch, get_input_url, write_atomic
+
+
+class DownloadResult(NamedTuple):
+    day: int
+    status: str
+    """One of ``exists``, ``cached``, ``fetched`` or ``error``."""
+    error: str | None = None
+
+
+class RateLimiter:
+    """Spaces out callers so that at most ``rate`` of them proceed per second."""
+
+    def __init__(self, rate: float) -> None:
+        if not rate > 0:
+            raise ValueError(f"rate must be positive: {rate!r}")
+
+        self.interval = 1 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def parse_days(value: str) -> list[int]:
+    """Parses a list of days such as ``1-25`` or ``1,3,5-7``."""
+    days = set()
+
+    try:
+        for item in value.split(","):
+            start, _, end = item.partition("-")
+            days.update(range(int(start), int(end or start) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid list of days: {value!r}") from None
+
+    if not days or min(days) < 1 or max(days) > 25:
+        raise argparse.ArgumentTypeError(f"days must be between 1 and 25: {value!r}")
+
+    return sorted(days)
+
+
+def parse_positive(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {value!r}") from None
+
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be positive: {value!r}")
+
+    return number
+
+
+def parse_concurrency(value: str) -> int:
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count: {value!r}") from None
+
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"count must be at least 1: {value!r}")
+
+    return count
+
+
+async def download_day(
+    year: int,
+    day: int,
+    session_token: str,
+    semaphore: asyncio.Semaphore,
+    limiter: RateLimiter,
+    overwrite: bool = False,
+) -> DownloadResult:
+    """Downloads the input for ``year`` and ``day`` unless it already exists.
+
+    Inputs already in the response cache are written out without counting
+    against the rate limit.
+    """
+    path = get_input_path(year, day)
+    if path.exists() and not overwrite:
+        return DownloadResult(day, "exists")
+
+    url = get_input_url(year, day)
+    cached = ResponseCache().lookup(url, session_token) is not None
+
+    async with semaphore:
+        if not cached:
+            await limiter.wait()
+
+        try:
+            result = await asyncio.to_thread(
+                fetch, url, session_token, revalidate=False
+            )
+        except InputFetchError as exc:
+            return DownloadResult(day, "error", str(exc))
+
+    await asyncio.to_thread(write_atomic, path, result.content)
+    return DownloadResult(day, "cached" if result.cached else "fetched")
+
+
+async def download_inputs(
+    year: int,
+    days: list[int],
+    session_token: str,
+    concurrency: int = 5,
+    rate: float = 5.0,
+    overwrite: bool = False,
+) -> list[DownloadResult]:
+    """Downloads the inputs for ``days`` of ``year`` with at most ``concurrency``
+    requests in flight and at most ``rate`` requests started per second."""
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1: {concurrency!r}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+
+    tasks = [
+        download_day(year, day, session_token, semaphore, limiter, overwrite)
+        for day in days
+    ]
+
+    results = []
+    for task in asyncio.as_completed(tasks):
+        result = await task
+        results.append(result)
+
+        message = result.error or str(get_input_path(year, result.day))
+        print(f"{year} day {result.day:>2}: {result.status} ({message})")
+
+    return results
+
+
+def run_cli(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="aocgen fetch", description="Download the inputs for a year at once."
+    )
+
+    parser.add_argument("year", type=int)
+    parser.add_argument("-d", "--days", type=parse_days, default=list(range(1, 26)))
+    parser.add_argument("-K", "--key", type=Path, default=None)
+    parser.add_argument("-c", "--concurrency", type=parse_concurrency, default=5)
+    parser.add_argument(
+        "-r",
+        "--rate",
+        type=parse_positive,
+        default=5.0,
+        help="maximum requests per second",
+    )
+    parser.add_argument(
+        "--overwrite", action="store_true", help="replace existing input files"
+    )
+
+    args = parser.parse_args(argv)
+
+    session_token = load_session_token(args.key)
+    if session_token is None:
+        parser.exit(
+            1,
+            "E: No session token found. Set AOC_SESSION_TOKEN, create a TOKEN file "
+            "or pass -K/--key.\n",
+        )
+
+    results = asyncio.run(
+        download_inputs(
+            args.year,
+            args.days,
+            session_token,
+            args.concurrency,
+            args.rate,
+            args.overwrite,
+        )
+    )
+
+    if any(result.status == "error" for result in results):
+        parser.exit(1)
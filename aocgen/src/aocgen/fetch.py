@@ -0,0 +1,264 @@
+"""Fetches puzzle inputs over a pooled HTTP session with an on-disk cache.
+
+Responses are stored by the SHA-256 digest of their content under
+``<cache>/objects``, while ``<cache>/entries`` maps each (url, session token) pair
+to its digest along with the ``ETag`` and ``Last-Modified`` validators needed to
+revalidate it. Session tokens are never written to the cache, only their hash.
+
+The base URL may be changed with the ``AOC_BASE_URL`` environment variable, for
+example to point aocgen at a local server.
+"""
+
+import email.utils
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = "https://adventofcode.com"
+DEFAULT_CACHE_DIR = Path(".aocgen") / "cache"
+USER_AGENT = "aescarias/aocgen (contact=lotta.dev@outlook.com)"
+
+# status codes worth retrying as they usually indicate a transient failure
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# the longest wait requested through Retry-After that is honoured, in seconds
+MAX_RETRY_AFTER = 60.0
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+class InputFetchError(Exception):
+    pass
+
+
+class FetchResult(NamedTuple):
+    content: bytes
+    digest: str
+    cached: bool
+    """Whether the content was served from the cache."""
+
+
+def get_base_url() -> str:
+    return os.environ.get("AOC_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+def get_input_url(year: int, day: int) -> str:
+    return f"{get_base_url()}/{year}/day/{day}/input"
+
+
+def get_session() -> requests.Session:
+    """Gets the session shared by all requests so that connections are reused."""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers["User-Agent"] = USER_AGENT
+
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+
+        return _session
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Writes ``data`` to ``path`` such that readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+class ResponseCache:
+    """A content-addressed store of responses keyed by URL and session token."""
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR) -> None:
+        self.root = root
+
+    def _entry_path(self, url: str, session_token: str) -> Path:
+        token_hash = hashlib.sha256(session_token.encode()).hexdigest()
+        key = hashlib.sha256(f"{url}\0{token_hash}".encode()).hexdigest()
+        return self.root / "entries" / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def lookup(self, url: str, session_token: str) -> dict[str, str] | None:
+        """Gets the cache entry for ``url``, if its content is still stored.
+
+        Entries that cannot be read (such as ones cut short by a crash) are treated
+        as missing.
+        """
+        entry_path = self._entry_path(url, session_token)
+        try:
+            entry = json.loads(entry_path.read_text())
+            if not self._object_path(entry["digest"]).exists():
+                return None
+        except (ValueError, KeyError, TypeError, OSError):
+            return None
+
+        return entry
+
+    def read(self, digest: str) -> bytes:
+        return self._object_path(digest).read_bytes()
+
+    def store(
+        self,
+        url: str,
+        session_token: str,
+        content: bytes,
+        headers: Mapping[str, str],
+    ) -> str:
+        """Stores ``content`` along with its validators, returning its digest."""
+        digest = hashlib.sha256(content).hexdigest()
+
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            write_atomic(object_path, content)
+
+        entry = {"digest": digest}
+        for name in ("ETag", "Last-Modified"):
+            if name in headers:
+                entry[name] = headers[name]
+
+        write_atomic(self._entry_path(url, session_token), json.dumps(entry).encode())
+        return digest
+
+
+def _get_retry_after(response: requests.Response) -> float | None:
+    """Gets the delay in seconds requested by the ``Retry-After`` header of
+    ``response``, given either as a number of seconds or as a date."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+def _request(
+    url: str,
+    session_token: str,
+    headers: dict[str, str],
+    timeout: float,
+    retries: int,
+    backoff: float,
+) -> requests.Response:
+    """Sends a GET request, retrying connection errors and transient failures up
+    to ``retries`` times with an exponential ``backoff`` (in seconds).
+
+    When the server asks to wait through ``Retry-After``, it is waited for instead,
+    unless that is longer than :data:`MAX_RETRY_AFTER`, in which case the failed
+    response is returned right away.
+    """
+    session = get_session()
+
+    for attempt in range(retries + 1):
+        delay = backoff * 2**attempt
+        try:
+            response = session.get(
+                url,
+                cookies={"session": session_token},
+                headers=headers,
+                timeout=timeout,
+            )
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            if attempt == retries:
+                raise InputFetchError(f"Could not fetch input: {exc}") from exc
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+
+            retry_after = _get_retry_after(response)
+            if retry_after is not None:
+                if retry_after > MAX_RETRY_AFTER:
+                    return response
+                delay = retry_after
+
+            # release the connection to the pool before retrying
+            response.close()
+
+        time.sleep(delay)
+
+    raise AssertionError("unreachable")
+
+
+def fetch(
+    url: str,
+    session_token: str,
+    *,
+    cache: ResponseCache | None = None,
+    revalidate: bool = True,
+    timeout: float = 10.0,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> FetchResult:
+    """Fetches ``url`` on behalf of the user identified by ``session_token``.
+
+    Cached responses are revalidated with ``If-None-Match`` and
+    ``If-Modified-Since`` unless ``revalidate`` is False, in which case they are
+    returned without contacting the server at all.
+    """
+    cache = cache or ResponseCache()
+    entry = cache.lookup(url, session_token)
+
+    if entry is not None and not revalidate:
+        return FetchResult(cache.read(entry["digest"]), entry["digest"], True)
+
+    headers = {}
+    if entry is not None:
+        if "ETag" in entry:
+            headers["If-None-Match"] = entry["ETag"]
+        if "Last-Modified" in entry:
+            headers["If-Modified-Since"] = entry["Last-Modified"]
+
+    response = _request(url, session_token, headers, timeout, retries, backoff)
+
+    if response.status_code == 304 and entry is not None:
+        return FetchResult(cache.read(entry["digest"]), entry["digest"], True)
+    elif not response.ok:
+        raise InputFetchError(
+            f"Could not fetch input due to {response.status_code} {response.reason}: "
+            f"{response.text!r}"
+        )
+
+    digest = cache.store(url, session_token, response.content, response.headers)
+    return FetchResult(response.content, digest, False)
+
+
+def get_puzzle_input(
+    year: int, day: int, session_token: str, *, revalidate: bool = False
+) -> str:
+    """Gets the puzzle input for ``year`` and ``day``.
+
+    As puzzle inputs never change once released, cached inputs are not
+    revalidated unless ``revalidate`` is True.
+    """
+    return fetch(
+        get_input_url(year, day), session_token, revalidate=revalidate
+    ).content.decode()
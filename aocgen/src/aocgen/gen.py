@@ -0,0 +1,426 @@
+"""Generates synthetic puzzle inputs of arbitrary size for scaling tests.
+
+Each generator takes a seeded random number generator and a size, and yields the
+lines of a valid input for its puzzle. The meaning of the size depends on the
+puzzle (the number of lines, the side of a grid, ...) and generators may accept
+further keyword options. Lines are written out in batches as they are generated,
+so that very large inputs can be produced without holding them in memory.
+"""
+
+import argparse
+import random
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+
+GeneratorFunc = Callable[..., Iterator[str]]
+
+
+class InputGenerator(NamedTuple):
+    func: GeneratorFunc
+    default_size: int
+    size_unit: str
+    """What the size of the input refers to, for example ``lines``."""
+
+
+GENERATORS: dict[tuple[int, int], InputGenerator] = {}
+
+
+def register(
+    year: int, day: int, default_size: int, size_unit: str
+) -> Callable[[GeneratorFunc], GeneratorFunc]:
+    """Registers an input generator for ``year`` and ``day``."""
+
+    def decorator(func: GeneratorFunc) -> GeneratorFunc:
+        GENERATORS[(year, day)] = InputGenerator(func, default_size, size_unit)
+        return func
+
+    return decorator
+
+
+@register(2022, 1, 250, "elves")
+def gen_calories(rng: random.Random, size: int) -> Iterator[str]:
+    for elf in range(size):
+        if elf:
+            yield ""
+
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
+
+
+@register(2022, 2, 2500, "rounds")
+def gen_strategy_guide(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+@register(2024, 1, 1000, "lines")
+def gen_location_lists(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}"
+
+
+@register(2024, 2, 1000, "reports")
+def gen_reports(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        level = rng.randint(1, 99)
+        sign = rng.choice((-1, 1))
+
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            # mostly safe steps, with the occasional unsafe one
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-3, 6)
+            level += sign * step
+            levels.append(level)
+
+        yield " ".join(map(str, levels))
+
+
+@register(2024, 3, 6, "lines")
+def gen_corrupted_memory(
+    rng: random.Random, size: int, instructions: int = 120
+) -> Iterator[str]:
+    garbage = "!@#$%^&*()[]{}<>?+-_/ ',:;select whomul"
+
+    def make_instruction() -> str:
+        roll = rng.random()
+        if roll < 0.6:
+            return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.7:
+            return "do()"
+        elif roll < 0.8:
+            return "don't()"
+
+        # a malformed instruction
+        return f"mul[{rng.randint(1, 999)},{rng.randint(1, 999)})"
+
+    for _ in range(size):
+        yield "".join(
+            "".join(rng.choices(garbage, k=rng.randint(0, 12))) + make_instruction()
+            for _ in range(instructions)
+        )
+
+
+@register(2024, 4, 140, "columns and rows")
+def gen_word_search(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield "".join(rng.choices("XMAS", k=size))
+
+
+@register(2024, 5, 200, "updates")
+def gen_print_queue(rng: random.Random, size: int, pages: int = 49) -> Iterator[str]:
+    if pages < 6:
+        raise ValueError(f"pages must be at least 6 (got {pages})")
+
+    # every pair of pages is ordered according to one random permutation
+    order = rng.sample(range(10, 100), k=min(pages, 90))
+    rank = {page: index for index, page in enumerate(order)}
+
+    for before_index, before in enumerate(order):
+        for after in order[before_index + 1 :]:
+            yield f"{before}|{after}"
+
+    yield ""
+
+    for _ in range(size):
+        update = rng.sample(order, k=rng.randrange(5, min(len(order), 24), 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+
+        yield ",".join(map(str, update))
+
+
+OBSTACLE, EMPTY = ord("#"), ord(".")
+# the number of maps tried before giving up on finding one the guard escapes
+MAX_MAP_ATTEMPTS = 100
+
+
+def _guard_escapes(grid: bytearray, width: int, height: int, start: int) -> bool:
+    """Checks whether the guard starting at ``start`` (facing up) leaves the map."""
+    moves = ((0, -1), (1, 0), (0, 1), (-1, 0))
+    seen = bytearray(width * height)
+
+    x, y = start % width, start // width
+    direction = 0
+    while True:
+        index = y * width + x
+        if seen[index] & (1 << direction):
+            return False
+        seen[index] |= 1 << direction
+
+        dx, dy = moves[direction]
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < width and 0 <= ny < height):
+            return True
+
+        if grid[ny * width + nx] == OBSTACLE:
+            direction = (direction + 1) % 4
+        else:
+            x, y = nx, ny
+
+
+@register(2024, 6, 130, "columns and rows")
+def gen_guard_map(
+    rng: random.Random, size: int, density: float = 0.05
+) -> Iterator[str]:
+    if not 0 <= density < 1:
+        raise ValueError(f"density must be at least 0 and below 1 (got {density})")
+
+    cells = size * size
+
+    # maps where the guard walks in a loop are not valid inputs, so keep trying
+    for _ in range(MAX_MAP_ATTEMPTS):
+        grid = bytearray(
+            OBSTACLE if rng.random() < density else EMPTY for _ in range(cells)
+        )
+        # like in real inputs, the guard starts around the center of the map
+        x, y = (rng.randrange(size // 4, size - size // 4) for _ in range(2))
+        start = y * size + x
+        grid[start] = ord("^")
+
+        if _guard_escapes(grid, size, size, start):
+            break
+    else:
+        raise ValueError(
+            f"no map the guard escapes found in {MAX_MAP_ATTEMPTS} attempts "
+            f"(try a lower density than {density})"
+        )
+
+    for y in range(size):
+        yield grid[y * size : (y + 1) * size].decode()
+
+
+MAX_CALIBRATION = 10**15
+
+
+@register(2024, 7, 850, "equations")
+def gen_calibrations(
+    rng: random.Random, size: int, operands: int = 12
+) -> Iterator[str]:
+    if operands < 2:
+        raise ValueError(f"operands must be at least 2 (got {operands})")
+
+    for _ in range(size):
+        values = [rng.randint(1, 99) for _ in range(rng.randint(2, operands))]
+
+        if rng.random() < 0.5:
+            # a solvable equation, using any of the three operators
+            target = values[0]
+            for count, value in enumerate(values[1:], 2):
+                operator = rng.randrange(3)
+                if operator == 0:
+                    target += value
+                elif operator == 1:
+                    target *= value
+                else:
+                    target = int(f"{target}{value}")
+
+                # keep targets within the range of real inputs
+                if target > MAX_CALIBRATION:
+                    del values[count:]
+                    break
+        else:
+            target = rng.randint(1, 10 ** rng.randint(3, 12))
+
+        yield f"{target}: {' '.join(map(str, values))}"
+
+
+@register(2024, 12, 140, "columns and rows")
+def gen_garden(rng: random.Random, size: int, plants: int = 26) -> Iterator[str]:
+    if not 1 <= plants <= 26:
+        raise ValueError(f"plants must be between 1 and 26 (got {plants})")
+
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:plants]
+
+    # each plot mostly copies the plant to its left or above, forming regions
+    above = rng.choices(letters, k=size)
+    for _ in range(size):
+        row = []
+        for x in range(size):
+            roll = rng.random()
+            if roll < 0.45 and x:
+                row.append(row[-1])
+            elif roll < 0.9:
+                row.append(above[x])
+            else:
+                row.append(rng.choice(letters))
+
+        yield "".join(row)
+        above = row
+
+
+@register(2024, 13, 320, "claw machines")
+def gen_claw_machines(rng: random.Random, size: int) -> Iterator[str]:
+    for machine in range(size):
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            if ax * by != ay * bx:  # buttons must not move in the same direction
+                break
+
+        if rng.random() < 0.5:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+
+        if machine:
+            yield ""
+        yield f"Button A: X+{ax}, Y+{ay}"
+        yield f"Button B: X+{bx}, Y+{by}"
+        yield f"Prize: X={px}, Y={py}"
+
+
+# the robots needed to draw the outline of the 31x33 picture
+FRAME_ROBOTS = 2 * 31 + 2 * 31
+
+
+@register(2024, 14, 500, "robots")
+def gen_robots(
+    rng: random.Random, size: int, width: int = 101, height: int = 103
+) -> Iterator[str]:
+    # the picture is a 31x33 frame, which must fit with room to move around
+    if width < 32 or height < 34:
+        raise ValueError(f"the area must be at least 32x34 (got {width}x{height})")
+    if size < FRAME_ROBOTS:
+        raise ValueError(f"size must be at least {FRAME_ROBOTS} to form the picture")
+
+    # robots forming a framed picture at a random step, so that part 2 terminates
+    step = rng.randrange(100, width * height)
+    left, top = rng.randrange(width - 31), rng.randrange(height - 33)
+
+    frame = [(left + x, top + y) for x in range(31) for y in (0, 32)]
+    frame += [(left + x, top + y) for x in (0, 30) for y in range(1, 32)]
+
+    for index in range(size):
+        vx, vy = rng.randint(-100, 100), rng.randint(-100, 100)
+
+        if index < len(frame):
+            x, y = frame[index]
+            x, y = (x - vx * step) % width, (y - vy * step) % height
+        else:
+            x, y = rng.randrange(width), rng.randrange(height)
+
+        yield f"p={x},{y} v={vx},{vy}"
+
+
+def write_lines(lines: Iterable[str], fp: TextIO, batch_size: int = 8192) -> int:
+    """Writes ``lines`` to ``fp`` in batches, returning the number written."""
+    written = 0
+    batch: list[str] = []
+
+    for line in lines:
+        batch.append(line)
+        if len(batch) == batch_size:
+            fp.write("\n".join(batch) + "\n")
+            written += len(batch)
+            batch.clear()
+
+    if batch:
+        fp.write("\n".join(batch) + "\n")
+        written += len(batch)
+
+    return written
+
+
+def generate(
+    year: int,
+    day: int,
+    fp: TextIO,
+    size: int | None = None,
+    seed: int = 0,
+    **options: Any,
+) -> int:
+    """Writes a synthetic input for ``year`` and ``day`` to ``fp``, returning the
+    number of lines written.
+
+    Generators raise :class:`TypeError` for unknown options and :class:`ValueError`
+    for invalid ones, before any line is written.
+    """
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for {year} day {day}")
+
+    generator = GENERATORS[(year, day)]
+    rng = random.Random(seed)
+    size = generator.default_size if size is None else size
+
+    return write_lines(generator.func(rng, size, **options), fp)
+
+
+def parse_option(value: str) -> tuple[str, int | float]:
+    name, sep, number = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE: {value!r}")
+
+    try:
+        return name, int(number)
+    except ValueError:
+        pass
+
+    try:
+        return name, float(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {number!r}") from None
+
+
+def run_cli(argv: list[str] | None = None) -> None:
+    available = ", ".join(
+        f"{year}/{day} ({generator.size_unit})"
+        for (year, day), generator in sorted(GENERATORS.items())
+    )
+    parser = argparse.ArgumentParser(
+        prog="aocgen gen",
+        description="Generate a synthetic puzzle input of arbitrary size.",
+        epilog=f"Available generators: {available}",
+    )
+
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("-n", "--size", type=int, default=None)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="defaults to standard output"
+    )
+    parser.add_argument(
+        "-P",
+        "--option",
+        type=parse_option,
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="an option specific to the generator, such as operands=12 for 2024/7",
+    )
+
+    args = parser.parse_args(argv)
+    if args.size is not None and args.size <= 0:
+        parser.error(f"size must be positive (got {args.size})")
+
+    if (args.year, args.day) not in GENERATORS:
+        from .runner import SolutionError, get_solution_path, load_solution
+
+        # solutions made from the template register a generator when loaded
+        if get_solution_path(args.year, args.day).exists():
+            try:
+                load_solution(args.year, args.day)
+            except SolutionError as exc:
+                parser.exit(1, f"E: {exc}\n")
+
+    if (args.year, args.day) not in GENERATORS:
+        parser.exit(1, f"E: No input generator for {args.year} day {args.day}.\n")
+
+    options = dict(args.option)
+    try:
+        if args.output is None:
+            generate(args.year, args.day, sys.stdout, args.size, args.seed, **options)
+            return
+
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("w") as fp:
+            count = generate(args.year, args.day, fp, args.size, args.seed, **options)
+    except (TypeError, ValueError) as exc:
+        # the output is left empty, as nothing was generated
+        if args.output is not None:
+            args.output.unlink(missing_ok=True)
+        parser.error(str(exc))
+
+    print(f"Wrote {count} lines to {args.output}")
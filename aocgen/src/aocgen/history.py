@@ -0,0 +1,38 @@
+"""Reads and writes the benchmark history file."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+DEFAULT_HISTORY_PATH = Path(".aocgen") / "bench_history.json"
+
+
+def result_key(year: int, day: int, part: int) -> str:
+    """Gets the key under which the results of a part are stored in a run."""
+    return f"{year}/{day:02d}/{part}"
+
+
+def load_history(path: Path = DEFAULT_HISTORY_PATH) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+
+    return json.loads(path.read_text())["runs"]
+
+
+def save_history(path: Path, runs: list[dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps({"runs": runs}, indent=2))
+    os.replace(temp_path, path)
+
+
+def get_recorded_durations(runs: list[dict[str, Any]]) -> dict[str, int]:
+    """Gets the most recently recorded median time of each part in ``runs``."""
+    durations = {}
+    for run in runs:
+        for key, result in run["results"].items():
+            durations[key] = result["median_ns"]
+
+    return durations
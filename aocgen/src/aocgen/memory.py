@@ -0,0 +1,195 @@
+"""Measures the memory used by each part of a solution, optionally under a ceiling.
+
+Each part is run in a freshly spawned process so that its peak resident set size
+is not inflated by earlier parts (or by the parent process, as it would be when
+forking), and so that a memory ceiling only applies to the part being measured.
+Parts that are only timed are run the same way when they are given a ceiling.
+"""
+
+import multiprocessing
+import sys
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from .puzzleinput import PuzzleInput
+
+if TYPE_CHECKING:
+    from .runner import PartResult
+
+T = TypeVar("T")
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+# frames belonging to the profiling machinery rather than the solution
+IGNORED_ALLOC_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>")
+
+
+class MemoryLimitError(Exception):
+    pass
+
+
+class AllocationSite(NamedTuple):
+    filename: str
+    lineno: int
+    size: int
+    count: int
+
+
+class MemoryUsage(NamedTuple):
+    answer: Any
+    peak_bytes: int
+    """The peak amount of memory allocated by Python (as traced by tracemalloc)."""
+    max_rss_bytes: int | None
+    """The peak resident set size of the process, if known."""
+    sites: list[AllocationSite]
+    """The lines holding the most memory once the part has been solved."""
+
+
+def parse_size(value: str) -> int:
+    """Parses a size in bytes such as ``512M`` or ``2G`` (in powers of 1024)."""
+    number, unit = value.strip().rstrip("iBb"), ""
+    if number[-1:].upper() in _SIZE_UNITS:
+        number, unit = number[:-1], number[-1:].upper()
+
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except (ValueError, OverflowError):  # also raised for "inf" and "nan"
+        raise ValueError(f"invalid size: {value!r}") from None
+
+    if size <= 0:
+        raise ValueError(f"size must be positive: {value!r}")
+
+    return size
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GiB"
+
+
+def set_memory_limit(limit: int | None) -> None:
+    """Limits the address space of the current process to ``limit`` bytes, so that
+    allocating past it raises :class:`MemoryError`."""
+    if limit is None:
+        return
+
+    import resource
+
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def get_max_rss() -> int | None:
+    """Gets the peak resident set size of the current process in bytes."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS but in kibibytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _measure(year: int, day: int, part: int, data: bytes, top: int) -> MemoryUsage:
+    """Measures a part in the spawned process."""
+    from .runner import load_solution
+
+    module = load_solution(year, day)
+    solver = getattr(module, f"part{part}")
+
+    tracemalloc.start()
+    try:
+        parsed_data = module.parse(PuzzleInput.from_bytes(data))
+        answer = solver(parsed_data)
+
+        # the parsed data is still alive here, as it is in most solutions
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    except MemoryError:
+        # the data allocated by the part is freed as the exception propagates
+        raise MemoryLimitError from None
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, filename) for filename in IGNORED_ALLOC_FILES]
+    )
+    sites = [
+        AllocationSite(
+            stat.traceback[0].filename, stat.traceback[0].lineno, stat.size, stat.count
+        )
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+    return MemoryUsage(answer, peak, get_max_rss(), sites)
+
+
+def _run(year: int, day: int, part: int, data: bytes) -> "PartResult":
+    """Runs a part in the spawned process."""
+    from .runner import load_solution, run_part
+
+    try:
+        return run_part(load_solution(year, day), part, data)
+    except MemoryError:
+        raise MemoryLimitError from None
+
+
+def _run_spawned(limit: int | None, func: Callable[..., T], *args: Any) -> T:
+    """Calls ``func`` with ``args`` in a freshly spawned process limited to
+    ``limit`` bytes of address space, raising :class:`MemoryLimitError` if it runs
+    out of memory."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=context,
+        initializer=set_memory_limit,
+        initargs=(limit,),
+    ) as executor:
+        try:
+            return executor.submit(func, *args).result()
+        except (MemoryLimitError, MemoryError, BrokenProcessPool) as exc:
+            # the process may also die if it runs out of memory outside the part,
+            # which can only be told apart from a crash when a limit was set
+            if isinstance(exc, BrokenProcessPool) and limit is None:
+                raise
+
+            raise MemoryLimitError("ran out of memory") from None
+
+
+def run_limited(
+    year: int, day: int, part: int, data: bytes, limit: int | None
+) -> "PartResult":
+    """Runs ``part`` of the solution for ``year`` and ``day`` against the input
+    ``data`` as :func:`aocgen.runner.run_part` does, but in a freshly spawned
+    process limited to ``limit`` bytes of address space (see :func:`measure_memory`).
+    """
+    return _run_spawned(limit, _run, year, day, part, data)
+
+
+def measure_memory(
+    year: int,
+    day: int,
+    part: int,
+    data: bytes,
+    top: int = 5,
+    limit: int | None = None,
+) -> MemoryUsage:
+    """Measures the memory used by ``part`` of the solution for ``year`` and ``day``
+    against the input ``data``, reporting the ``top`` allocation sites.
+
+    If ``limit`` is given, the part is aborted with :class:`MemoryLimitError` once
+    its process uses more than ``limit`` bytes of address space. Note that this
+    includes the interpreter itself and any memory reserved but not yet used.
+    """
+    return _run_spawned(limit, _measure, year, day, part, data, top)
@@ -0,0 +1,108 @@
+"""Profiles solutions for CPU time or memory allocations."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TextIO
+
+from . import PROFILE_MODES
+from .memory import IGNORED_ALLOC_FILES
+
+DEFAULT_PROFILE_DIR = Path(".aocgen") / "profiles"
+
+
+class ProfileSession:
+    """Profiles the code that runs between :meth:`start` and :meth:`stop`.
+
+    In ``cpu`` mode, the code runs under cProfile and the ``top`` functions by
+    cumulative and self time are reported, while the full profile is written to
+    ``dump_path`` as a ``.pstats`` file. In ``alloc`` mode, tracemalloc reports
+    the ``top`` lines whose allocations are still held when profiling stops,
+    along with the peak memory usage.
+    """
+
+    def __init__(self, mode: str, top: int = 20, dump_path: Path | None = None) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode: {mode!r}")
+
+        self.mode = mode
+        self.top = top
+        self.dump_path = dump_path
+
+        self._profiler: cProfile.Profile | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._peak = 0
+
+    def start(self) -> None:
+        if self.mode == "cpu":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        if self.mode == "cpu":
+            assert self._profiler is not None
+            self._profiler.disable()
+        elif tracemalloc.is_tracing():
+            self._snapshot = tracemalloc.take_snapshot()
+            _, self._peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    def report(self, file: TextIO | None = None) -> None:
+        file = file or sys.stderr
+
+        if self.mode == "cpu":
+            self._report_cpu(file)
+        else:
+            self._report_alloc(file)
+
+    def finish(self) -> None:
+        """Stops profiling and reports the results."""
+        self.stop()
+        self.report()
+
+    def _report_cpu(self, file: TextIO) -> None:
+        assert self._profiler is not None
+
+        for sort_key, title in (("cumulative", "cumulative"), ("tottime", "self")):
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=stream)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(self.top)
+
+            print(f"Top {self.top} functions by {title} time:", file=file)
+            print(stream.getvalue().strip("\n"), file=file)
+            print(file=file)
+
+        if self.dump_path is not None:
+            self.dump_path.parent.mkdir(parents=True, exist_ok=True)
+            self._profiler.dump_stats(self.dump_path)
+            print(f"Full profile written to {self.dump_path}", file=file)
+
+    def _report_alloc(self, file: TextIO) -> None:
+        assert self._snapshot is not None
+
+        snapshot = self._snapshot.filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in IGNORED_ALLOC_FILES]
+        )
+        stats = snapshot.statistics("lineno")
+
+        print(f"Top {self.top} lines by memory held when profiling stopped:", file=file)
+        for index, stat in enumerate(stats[: self.top], 1):
+            frame = stat.traceback[0]
+            print(
+                f"{index:>3}. {frame.filename}:{frame.lineno}: "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} block(s)",
+                file=file,
+            )
+
+        print(f"Peak traced memory: {self._peak / 1024:.1f} KiB", file=file)
+
+
+def get_dump_path(year: int, day: int, part: int) -> Path:
+    return DEFAULT_PROFILE_DIR / f"{year}-day{day:02d}-part{part}.pstats"
@@ -0,0 +1,148 @@
+"""A streaming interface over puzzle inputs."""
+
+from __future__ import annotations
+
+import io
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+_INT_PATTERN = re.compile(rb"-?\d+")
+
+
+class PuzzleInput:
+    """A puzzle input read lazily from a binary stream.
+
+    Lines are read through the stream's buffer as they are iterated, so solutions
+    may start working before the whole input has been read. If the stream is
+    seekable, each iteration starts over from the beginning of the input.
+    """
+
+    def __init__(self, source: BinaryIO | str | Path) -> None:
+        if isinstance(source, (str, Path)):
+            self.path: Path | None = Path(source)
+            self._stream: BinaryIO | None = None
+        else:
+            self.path = None
+            self._stream = source
+
+        # a stream that cannot seek, once replaced by an in-memory copy
+        self._unbuffered: BinaryIO | None = None
+        # whether a stream that cannot seek was read from, so it cannot start over
+        self._consumed = False
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PuzzleInput:
+        return cls(io.BytesIO(data))
+
+    @classmethod
+    def from_text(cls, text: str) -> PuzzleInput:
+        return cls(io.BytesIO(text.encode()))
+
+    def __enter__(self) -> PuzzleInput:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+        if self._unbuffered is not None:
+            self._unbuffered.close()
+
+    def _rewind(self) -> BinaryIO:
+        """Gets the underlying stream, opening it or seeking back to its start."""
+        if self._stream is None:
+            assert self.path is not None
+            self._stream = self.path.open("rb")
+        elif self._stream.seekable():
+            self._stream.seek(0)
+        else:
+            self._consumed = True
+
+        return self._stream
+
+    def raw_lines(self) -> Iterator[bytes]:
+        """Iterates over the lines of the input as bytes, without line endings."""
+        for line in self._rewind():
+            yield line.rstrip(b"\r\n")
+
+    def lines(self) -> Iterator[str]:
+        """Iterates over the lines of the input, without line endings."""
+        for line in self._rewind():
+            yield line.rstrip(b"\r\n").decode()
+
+    def __iter__(self) -> Iterator[str]:
+        return self.lines()
+
+    def ints(self, *columns: int) -> Iterator[tuple[int, ...]]:
+        """Iterates over the integers found in each line of the input.
+
+        If ``columns`` are specified, only the integers at those positions are
+        included. Lines with no integers are skipped.
+        """
+        for line in self._rewind():
+            numbers = _INT_PATTERN.findall(line)
+            if not numbers:
+                continue
+
+            if columns:
+                numbers = [numbers[column] for column in columns]
+
+            yield tuple(map(int, numbers))
+
+    def paragraphs(self) -> Iterator[list[str]]:
+        """Iterates over the groups of lines in the input separated by blank lines."""
+        paragraph: list[str] = []
+
+        for line in self.lines():
+            if line.strip():
+                paragraph.append(line)
+            elif paragraph:
+                yield paragraph
+                paragraph = []
+
+        if paragraph:
+            yield paragraph
+
+    def bytes(self) -> bytes:
+        """Reads the whole input as bytes."""
+        return self._rewind().read()
+
+    def text(self) -> str:
+        """Reads the whole input as text."""
+        return self.bytes().decode()
+
+    def fileno(self) -> int:
+        """Gets the file descriptor of the input file, so that it can be mapped (see
+        ``aocutils.MappedFile``). Raises :class:`io.UnsupportedOperation` if the
+        input is not read from a file."""
+        return self._rewind().fileno()
+
+    def fingerprint(self) -> str:
+        """Gets the SHA-256 digest of the input (used by ``aocutils.cached_parse``).
+
+        A stream that cannot seek (such as a pipe) is first read into memory, so the
+        input can still be read afterwards. If such a stream was already read from,
+        the digest would not cover the whole input, so
+        :class:`io.UnsupportedOperation` is raised instead.
+        """
+        import hashlib
+
+        stream = self._stream
+        if stream is not None and not stream.seekable():
+            if self._consumed:
+                raise io.UnsupportedOperation("The input was already read.")
+
+            self._stream = io.BytesIO(stream.read())
+            self._unbuffered = stream
+
+        return hashlib.sha256(self.bytes()).hexdigest()
@@ -0,0 +1,629 @@
+"""Runs solutions in-process and times their parse and solve steps.
+
+A solution module is any ``YYYY/dayNN.py`` file exposing the following functions::
+
+    def parse(puzzle: PuzzleInput) -> Data: ...
+    def part1(data: Data) -> Answer: ...
+    def part2(data: Data) -> Answer: ...
+"""
+
+import argparse
+import importlib.util
+import io
+import math
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from . import PROFILE_MODES, has_input, read_input
+from .answers import AnswerStore, get_answer_key
+from .history import get_recorded_durations, load_history, result_key
+from .memory import (
+    MemoryLimitError,
+    format_bytes,
+    measure_memory,
+    parse_size,
+    run_limited,
+    set_memory_limit,
+)
+from .puzzleinput import PuzzleInput
+
+if TYPE_CHECKING:
+    from .profiling import ProfileSession
+
+PARTS = (1, 2)
+
+_YEAR_PATTERN = re.compile(r"\d{4}")
+_DAY_PATTERN = re.compile(r"day(\d{2})\.py")
+
+
+class SolutionError(Exception):
+    pass
+
+
+class PartResult(NamedTuple):
+    part: int
+    answer: Any
+    parse_ns: int
+    solve_ns: int
+
+    @property
+    def total_ns(self) -> int:
+        return self.parse_ns + self.solve_ns
+
+
+class Job(NamedTuple):
+    year: int
+    day: int
+    part: int
+
+
+class JobResult(NamedTuple):
+    job: Job
+    result: PartResult | None
+    error: str | None = None
+
+
+def get_solution_path(year: int, day: int, root: Path | None = None) -> Path:
+    """Gets the path of the solution file for ``year`` and ``day``."""
+    return (root or Path(".")) / str(year) / f"day{day:02d}.py"
+
+
+def discover_solutions(root: Path | None = None) -> list[tuple[int, int]]:
+    """Finds every ``YYYY/dayNN.py`` solution under ``root``."""
+    solutions = []
+
+    for year_dir in (root or Path(".")).iterdir():
+        if not year_dir.is_dir() or not _YEAR_PATTERN.fullmatch(year_dir.name):
+            continue
+
+        for path in year_dir.iterdir():
+            if match := _DAY_PATTERN.fullmatch(path.name):
+                solutions.append((int(year_dir.name), int(match[1])))
+
+    return sorted(solutions)
+
+
+def load_solution(year: int, day: int, root: Path | None = None) -> ModuleType:
+    """Imports the solution for ``year`` and ``day`` from its file path.
+
+    The module is registered as ``aoc{year}_day{day:02d}`` so that objects defined
+    in it can be pickled.
+    """
+    path = get_solution_path(year, day, root)
+    if not path.exists():
+        raise SolutionError(f"No solution file found at {path}")
+
+    name = f"aoc{year}_day{day:02d}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise SolutionError(f"Cannot import solution at {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    for attr in ("parse", "part1", "part2"):
+        if not callable(getattr(module, attr, None)):
+            raise SolutionError(f"Solution at {path} does not define {attr}()")
+
+    return module
+
+
+def run_part(module: ModuleType, part: int, data: bytes) -> PartResult:
+    """Runs ``part`` of the solution ``module`` against the input ``data``.
+
+    The input is parsed again for each part as solutions may mutate their parsed
+    data while solving.
+    """
+    solver = getattr(module, f"part{part}")
+
+    start = time.perf_counter_ns()
+    parsed_data = module.parse(PuzzleInput.from_bytes(data))
+    parsed = time.perf_counter_ns()
+    answer = solver(parsed_data)
+    solved = time.perf_counter_ns()
+
+    return PartResult(part, answer, parsed - start, solved - parsed)
+
+
+def profile_part(
+    module: ModuleType, part: int, data: bytes, session: "ProfileSession"
+) -> Any:
+    """Runs ``part`` of the solution ``module`` under a profiling ``session``,
+    returning its answer.
+
+    Profiling stops before the parsed data is released so that allocation
+    reports include it.
+    """
+    solver = getattr(module, f"part{part}")
+
+    session.start()
+    try:
+        parsed_data = module.parse(PuzzleInput.from_bytes(data))
+        answer = solver(parsed_data)
+    finally:
+        session.stop()
+
+    return answer
+
+
+def run_solution(
+    year: int,
+    day: int,
+    parts: tuple[int, ...] = PARTS,
+    input_path: Path | None = None,
+    root: Path | None = None,
+) -> list[PartResult]:
+    """Runs the specified ``parts`` of the solution for ``year`` and ``day``."""
+    module = load_solution(year, day, root)
+    data = read_input(year, day, input_path)
+
+    return [run_part(module, part, data) for part in parts]
+
+
+def get_answer_keys(
+    year: int,
+    day: int,
+    parts: tuple[int, ...] = PARTS,
+    input_path: Path | None = None,
+    root: Path | None = None,
+) -> dict[int, str]:
+    """Gets the keys under which the answers to ``parts`` are stored."""
+    source = get_solution_path(year, day, root).read_bytes()
+    data = read_input(year, day, input_path)
+
+    return {part: get_answer_key(year, day, part, source, data) for part in parts}
+
+
+def run_scaling(
+    module: ModuleType,
+    year: int,
+    day: int,
+    parts: tuple[int, ...] = PARTS,
+    sizes: tuple[int, ...] = (),
+    seed: int = 0,
+) -> Iterator[tuple[int, PartResult]]:
+    """Runs ``parts`` against synthetic inputs of each of the given ``sizes``
+    (see :mod:`aocgen.gen`), yielding each size along with its result."""
+    from .gen import generate
+
+    for size in sizes:
+        stream = io.StringIO()
+        generate(year, day, stream, size, seed)
+        data = stream.getvalue().encode()
+
+        for part in parts:
+            yield size, run_part(module, part, data)
+
+
+def _run_job(job: Job) -> PartResult:
+    """Runs a job in a worker process, reusing solutions it has already loaded."""
+    module = sys.modules.get(f"aoc{job.year}_day{job.day:02d}")
+    if module is None:
+        module = load_solution(job.year, job.day)
+
+    data = read_input(job.year, job.day)
+    return run_part(module, job.part, data)
+
+
+def schedule_jobs(jobs: list[Job], durations: Mapping[str, int]) -> list[Job]:
+    """Orders ``jobs`` longest-first according to their recorded ``durations``.
+
+    Jobs that have never been recorded are scheduled first as nothing is known
+    about how long they take.
+    """
+
+    def get_duration(job: Job) -> float:
+        return durations.get(result_key(*job), float("inf"))
+
+    return sorted(jobs, key=get_duration, reverse=True)
+
+
+def run_parallel(
+    jobs: list[Job],
+    workers: int | None = None,
+    durations: Mapping[str, int] | None = None,
+    memory_limit: int | None = None,
+) -> Iterator[JobResult]:
+    """Runs ``jobs`` across a pool of ``workers`` processes (one per core by
+    default), yielding their results as they finish.
+
+    Jobs are submitted longest-first based on ``durations`` so that the slowest
+    ones are not left to run on their own at the end. If ``memory_limit`` is given,
+    each worker is limited to that many bytes of address space and is spawned
+    rather than forked, so that the limit does not count memory inherited from
+    this process.
+    """
+    ordered = schedule_jobs(jobs, durations or {})
+    context = multiprocessing.get_context("spawn") if memory_limit else None
+
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=context,
+        initializer=set_memory_limit,
+        initargs=(memory_limit,),
+    ) as executor:
+        futures = {executor.submit(_run_job, job): job for job in ordered}
+
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield JobResult(job, future.result())
+            except MemoryError:
+                yield JobResult(job, None, format_aborted(memory_limit))
+            except Exception as exc:
+                yield JobResult(job, None, f"{type(exc).__name__}: {exc}")
+
+
+def format_duration(ns: int) -> str:
+    """Formats a duration in nanoseconds using the most appropriate unit."""
+    if ns < 1_000:
+        return f"{ns} ns"
+    elif ns < 1_000_000:
+        return f"{ns / 1_000:.2f} µs"
+    elif ns < 1_000_000_000:
+        return f"{ns / 1_000_000:.2f} ms"
+
+    return f"{ns / 1_000_000_000:.2f} s"
+
+
+def parse_parts(value: str) -> tuple[int, ...]:
+    if value == "all":
+        return PARTS
+    elif value in ("1", "2"):
+        return (int(value),)
+
+    raise argparse.ArgumentTypeError(f"invalid part: {value!r} (choose 1, 2 or all)")
+
+
+def parse_sizes(value: str) -> tuple[int, ...]:
+    try:
+        sizes = tuple(int(size) for size in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value!r}") from None
+
+    if any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError(f"sizes must be positive: {value!r}")
+
+    return sizes
+
+
+def format_result(result: PartResult) -> str:
+    return (
+        f"{result.answer!s:<20} "
+        f"parse {format_duration(result.parse_ns):>10}  "
+        f"solve {format_duration(result.solve_ns):>10}"
+    )
+
+
+def format_cached(answer: str) -> str:
+    return f"{answer:<20} (cached)"
+
+
+def format_growth(size: int, ns: int, last_size: int, last_ns: int) -> str:
+    """Formats the exponent k such that a time of ``last_ns`` at ``last_size`` grows
+    like ``size ** k`` to reach ``ns`` at ``size``."""
+    if not ns or not last_ns:
+        return "~n^?"
+
+    return f"~n^{math.log(ns / last_ns) / math.log(size / last_size):.2f}"
+
+
+def format_aborted(memory_limit: int | None) -> str:
+    if memory_limit is None:
+        return "aborted, ran out of memory"
+
+    return f"aborted, exceeded the memory limit of {format_bytes(memory_limit)}"
+
+
+def check_result(
+    result: PartResult, key: str, store: AnswerStore | None
+) -> tuple[str, bool]:
+    """Formats ``result`` and records its answer in ``store``, returning whether it
+    disagrees with the answer stored previously."""
+    line = format_result(result)
+    if store is None:
+        return line, False
+
+    stored = store.record(key, result.answer)
+    if stored is None:
+        return line, False
+
+    return f"{line}  MISMATCH (stored: {stored})", True
+
+
+def run_cli(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="aocgen run", description="Run and time Advent of Code solutions."
+    )
+
+    parser.add_argument("year", type=int, nargs="?")
+    parser.add_argument("day", type=int, nargs="?")
+    parser.add_argument("-p", "--part", type=parse_parts, default=PARTS)
+    parser.add_argument("-I", "--input", type=Path, default=None)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes when running several days",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cpu",
+        choices=PROFILE_MODES,
+        help="profile the solution for CPU time (default) or memory allocations",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="number of entries in profile reports"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="run parts even if their answer is stored and check that it matches",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="neither use nor store answers"
+    )
+    parser.add_argument(
+        "--scale",
+        type=parse_sizes,
+        default=None,
+        metavar="SIZES",
+        help="run against synthetic inputs of each size (e.g. 1000,10000,100000)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the peak memory and top allocation sites of each part",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=parse_size,
+        default=None,
+        metavar="SIZE",
+        help="abort parts using more than SIZE of address space (e.g. 512M or 2G)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="run the solution in a daemon started with 'aocgen serve'",
+    )
+
+    args = parser.parse_args(argv)
+    failed = False
+
+    if args.daemon:
+        if args.day is None:
+            parser.error("--daemon can only be used when running a single day")
+        if args.profile:
+            parser.error("--daemon cannot be combined with --profile")
+
+        from .daemon import DaemonError, run_with_daemon
+
+        try:
+            run_with_daemon(args.year, args.day, args.part, args.input)
+        except (DaemonError, OSError) as exc:
+            parser.exit(1, f"E: {exc}\n")
+        return
+
+    if args.scale:
+        if args.day is None:
+            parser.error("--scale can only be used when running a single day")
+
+        from .gen import GENERATORS
+
+        try:
+            # loading the solution registers its generator if it defines one
+            module = load_solution(args.year, args.day)
+        except (SolutionError, OSError) as exc:
+            parser.exit(1, f"E: {exc}\n")
+
+        if (args.year, args.day) not in GENERATORS:
+            parser.exit(1, f"E: No input generator for {args.year} day {args.day}.\n")
+
+        unit = GENERATORS[(args.year, args.day)].size_unit
+        print(f"{args.year} day {args.day} (size in {unit})")
+
+        previous: dict[int, tuple[int, PartResult]] = {}
+        for size, result in run_scaling(
+            module, args.year, args.day, args.part, args.scale
+        ):
+            line = f"  part {result.part} at {size:>10}: {format_result(result)}"
+
+            if result.part in previous and previous[result.part][0] != size:
+                last_size, last = previous[result.part]
+                parse = format_growth(size, result.parse_ns, last_size, last.parse_ns)
+                solve = format_growth(size, result.solve_ns, last_size, last.solve_ns)
+                line += f"  parse {parse}  solve {solve}"
+
+            previous[result.part] = (size, result)
+            print(line)
+        return
+
+    if args.profile:
+        if args.day is None:
+            parser.error("--profile can only be used when running a single day")
+
+        from .profiling import ProfileSession, get_dump_path
+
+        try:
+            module = load_solution(args.year, args.day)
+            data = read_input(args.year, args.day, args.input)
+        except (SolutionError, OSError) as exc:
+            parser.exit(1, f"E: {exc}\n")
+
+        for part in args.part:
+            dump_path = get_dump_path(args.year, args.day, part)
+            session = ProfileSession(args.profile, args.top, dump_path)
+
+            answer = profile_part(module, part, data, session)
+            print(f"{args.year} day {args.day} part {part}: {answer}")
+            session.report(sys.stdout)
+        return
+
+    if args.memory:
+        if args.day is None:
+            parser.error("--memory can only be used when running a single day")
+
+        try:
+            data = read_input(args.year, args.day, args.input)
+        except OSError as exc:
+            parser.exit(1, f"E: {exc}\n")
+
+        print(f"{args.year} day {args.day}")
+        for part in args.part:
+            try:
+                usage = measure_memory(
+                    args.year, args.day, part, data, args.top, args.memory_limit
+                )
+            except SolutionError as exc:
+                parser.exit(1, f"E: {exc}\n")
+            except MemoryLimitError:
+                print(f"  part {part}: {format_aborted(args.memory_limit)}")
+                failed = True
+                continue
+            except Exception as exc:
+                # raised by the solution, or the process running it died
+                print(f"  part {part}: failed, {type(exc).__name__}: {exc}")
+                failed = True
+                continue
+
+            max_rss = "unknown"
+            if usage.max_rss_bytes is not None:
+                max_rss = format_bytes(usage.max_rss_bytes)
+
+            print(
+                f"  part {part}: {usage.answer!s:<20} "
+                f"peak {format_bytes(usage.peak_bytes):>10}  max RSS {max_rss:>10}"
+            )
+            for site in usage.sites:
+                print(
+                    f"    {format_bytes(site.size):>10} in {site.count:>6} block(s)  "
+                    f"{site.filename}:{site.lineno}"
+                )
+
+        if failed:
+            parser.exit(1)
+        return
+
+    store = None if args.no_cache else AnswerStore()
+
+    if args.day is not None:
+        try:
+            keys = get_answer_keys(args.year, args.day, args.part, args.input)
+            cached = {
+                part: answer
+                for part, key in keys.items()
+                if store is not None
+                and not args.verify
+                and (answer := store.get(key)) is not None
+            }
+
+            remaining = tuple(part for part in args.part if part not in cached)
+            results = {}
+            errors: dict[int, str] = {}
+            if remaining:
+                data = read_input(args.year, args.day, args.input)
+                if args.memory_limit is None:
+                    module = load_solution(args.year, args.day)
+        except (SolutionError, OSError) as exc:
+            parser.exit(1, f"E: {exc}\n")
+
+        for part in remaining:
+            try:
+                if args.memory_limit is None:
+                    results[part] = run_part(module, part, data)
+                else:
+                    # each part gets a process of its own, as with --memory, so that
+                    # a part going over the limit does not take the others down
+                    results[part] = run_limited(
+                        args.year, args.day, part, data, args.memory_limit
+                    )
+            except MemoryLimitError:
+                errors[part] = format_aborted(args.memory_limit)
+            except Exception as exc:
+                # raised by the solution, or the process running it died
+                errors[part] = f"failed, {type(exc).__name__}: {exc}"
+
+        print(f"{args.year} day {args.day}")
+        for part in args.part:
+            if part in cached:
+                print(f"  part {part}: {format_cached(cached[part])}")
+                continue
+            if part in errors:
+                print(f"  part {part}: {errors[part]}")
+                failed = True
+                continue
+
+            line, mismatch = check_result(results[part], keys[part], store)
+            failed = failed or mismatch
+            print(f"  part {part}: {line}")
+
+        if store is not None:
+            store.save()
+        if failed:
+            parser.exit(1)
+        return
+
+    if args.input is not None:
+        parser.error("-I/--input can only be used when running a single day")
+
+    start = time.perf_counter_ns()
+
+    keys: dict[Job, str] = {}
+    for year, day in discover_solutions():
+        if args.year in (None, year) and has_input(year, day):
+            for part, key in get_answer_keys(year, day, args.part).items():
+                keys[Job(year, day, part)] = key
+
+    jobs = []
+    for job, key in keys.items():
+        answer = None if store is None or args.verify else store.get(key)
+        if answer is None:
+            jobs.append(job)
+        else:
+            label = f"{job.year} day {job.day:>2} part {job.part}"
+            print(f"{label}: {format_cached(answer)}")
+
+    total_ns = 0
+    durations = get_recorded_durations(load_history())
+
+    for job, result, error in run_parallel(
+        jobs, args.jobs, durations, args.memory_limit
+    ):
+        label = f"{job.year} day {job.day:>2} part {job.part}"
+        if result is None:
+            failed = True
+            print(f"{label}: E: {error}")
+        else:
+            total_ns += result.total_ns
+            line, mismatch = check_result(result, keys[job], store)
+            failed = failed or mismatch
+            print(f"{label}: {line}")
+
+    if store is not None:
+        store.save()
+
+    elapsed = time.perf_counter_ns() - start
+    print(
+        f"Ran {len(jobs)} part(s) in {format_duration(elapsed)} "
+        f"(sum of parts: {format_duration(total_ns)}, "
+        f"{len(keys) - len(jobs)} cached)"
+    )
+
+    if failed:
+        parser.exit(1)
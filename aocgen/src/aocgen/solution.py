@@ -0,0 +1,63 @@
+"""A registry of solutions, as used by the solution template.
+
+Solutions generated by ``aocgen YEAR DAY`` register their ``parse``, ``part1`` and
+``part2`` functions along with a generator of synthetic inputs, which makes them
+runnable directly, through ``aocgen run`` and ``aocgen bench``, and at increasing
+input sizes through ``aocgen run --scale``.
+"""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from . import PuzzleInput, get_user_input
+from .gen import GeneratorFunc
+from .gen import register as register_generator
+
+
+class Solution(NamedTuple):
+    year: int
+    day: int
+    parse: Callable[[PuzzleInput], Any]
+    part1: Callable[[Any], Any]
+    part2: Callable[[Any], Any]
+
+    def solve(self, part: int, puzzle: PuzzleInput) -> Any:
+        """Parses ``puzzle`` and solves the specified ``part``."""
+        solver = self.part1 if part == 1 else self.part2
+        return solver(self.parse(puzzle))
+
+    def main(self) -> None:
+        """Solves the part given on the command line (see :func:`get_user_input`)."""
+        args = get_user_input(self.year, self.day)
+        if args["part"] not in (1, 2):
+            raise SystemExit(f"E: Invalid part: {args['part']} (choose 1 or 2)")
+
+        with args["input"] as puzzle:
+            print(self.solve(args["part"], puzzle))
+
+
+SOLUTIONS: dict[tuple[int, int], Solution] = {}
+
+
+def register(
+    year: int,
+    day: int,
+    parse: Callable[[PuzzleInput], Any],
+    part1: Callable[[Any], Any],
+    part2: Callable[[Any], Any],
+    generate: GeneratorFunc | None = None,
+    default_size: int = 1000,
+    size_unit: str = "lines",
+) -> Solution:
+    """Registers the solution for ``year`` and ``day``.
+
+    If ``generate`` is given, it is also registered as the input generator for the
+    day (see :mod:`aocgen.gen`), producing inputs of ``default_size`` by default.
+    """
+    solution = Solution(year, day, parse, part1, part2)
+    SOLUTIONS[(year, day)] = solution
+
+    if generate is not None:
+        register_generator(year, day, default_size, size_unit)(generate)
+
+    return solution
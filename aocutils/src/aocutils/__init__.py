@@ -1,4 +1,39 @@
 from ._version import __version__ as __version__
-from .grid import Grid, Point, wrap, wrap_point
+from .cache import ParseCache, cached_parse
+from .components import Component, Components, label_components
+from .grid import (
+    OFFSETS4,
+    OFFSETS8,
+    Cursor,
+    Grid,
+    Point,
+    pack_point,
+    unpack_point,
+    wrap,
+    wrap_point,
+)
+from .mapped import MappedFile
+from .pointarray import PointArray
+from .sparsegrid import SparseGrid
+from .stateset import StateSet
 
-__all__ = ("Grid", "Point", "wrap", "wrap_point")
+__all__ = (
+    "ParseCache",
+    "cached_parse",
+    "Component",
+    "Components",
+    "label_components",
+    "OFFSETS4",
+    "OFFSETS8",
+    "Cursor",
+    "Grid",
+    "MappedFile",
+    "Point",
+    "PointArray",
+    "SparseGrid",
+    "StateSet",
+    "pack_point",
+    "unpack_point",
+    "wrap",
+    "wrap_point",
+)
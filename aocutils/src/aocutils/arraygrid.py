@@ -0,0 +1,139 @@
+"""
+A :class:`Grid` backend with vectorized whole-grid operations powered by NumPy.
+
+NumPy is an optional dependency. Use :data:`FastGrid` to get :class:`ArrayGrid`
+when NumPy is installed and the pure-Python :class:`Grid` otherwise; both support
+the same counting and matching methods.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from .grid import OFFSETS8, Grid
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _window(array: np.ndarray, x: int, y: int, width: int, height: int) -> np.ndarray:
+    return array[y : y + height, x : x + width]
+
+
+class ArrayGrid(Grid):
+    """A grid whose cells are also exposed as a 2-D ``uint8`` NumPy array.
+
+    :attr:`array` is a view of :attr:`Grid.cells`, so changes made through either
+    one are visible in the other.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fill: str = " ",
+        *,
+        cells: bytearray | None = None,
+        stride: int | None = None,
+    ) -> None:
+        if np is None:
+            raise ImportError("ArrayGrid requires NumPy to be installed.")
+
+        super().__init__(width, height, fill, cells=cells, stride=stride)
+        self.array = np.ndarray(
+            (height, width), np.uint8, buffer=self.cells, strides=(self.stride, 1)
+        )
+
+    def mask(self, value: str) -> np.ndarray:
+        """Returns a boolean array that is True where a cell's value is ``value``."""
+        return self.array == ord(value)
+
+    def shifted(self, dx: int, dy: int, fill: str = "\0") -> np.ndarray:
+        """Returns an array where each cell holds the value of the cell at an offset of
+        (dx, dy) from it, or ``fill`` if such cell is outside the grid."""
+        shifted = np.full_like(self.array, ord(fill))
+        if abs(dx) >= self.width or abs(dy) >= self.height:
+            return shifted
+
+        width, height = self.width - abs(dx), self.height - abs(dy)
+        _window(shifted, max(-dx, 0), max(-dy, 0), width, height)[...] = _window(
+            self.array, max(dx, 0), max(dy, 0), width, height
+        )
+
+        return shifted
+
+    def equals_neighbor(self, dx: int, dy: int) -> np.ndarray:
+        """Returns a boolean array that is True where a cell has the same value as
+        the cell at an offset of (dx, dy) from it. Cells whose neighbor is outside
+        the grid are always False."""
+        equal = np.zeros(self.array.shape, dtype=bool)
+        if abs(dx) >= self.width or abs(dy) >= self.height:
+            return equal
+
+        width, height = self.width - abs(dx), self.height - abs(dy)
+        _window(equal, max(-dx, 0), max(-dy, 0), width, height)[...] = _window(
+            self.array, max(-dx, 0), max(-dy, 0), width, height
+        ) == _window(self.array, max(dx, 0), max(dy, 0), width, height)
+
+        return equal
+
+    def count(self, value: str) -> int:
+        return int(np.count_nonzero(self.array == ord(value)))
+
+    def counts(self) -> dict[str, int]:
+        frequencies = np.bincount(self.array.ravel(), minlength=256)
+        return {
+            chr(value): int(frequencies[value]) for value in np.flatnonzero(frequencies)
+        }
+
+    def count_word(
+        self, word: str, directions: Iterable[tuple[int, int]] = OFFSETS8
+    ) -> int:
+        if not word:
+            raise ValueError("Cannot count an empty word.")
+
+        data = word.encode("ascii")
+        last = len(data) - 1
+
+        count = 0
+        for dx, dy in directions:
+            # the region of starting cells from which the whole word stays in the grid
+            x0, y0 = max(-dx * last, 0), max(-dy * last, 0)
+            width = self.width - abs(dx * last)
+            height = self.height - abs(dy * last)
+            if width <= 0 or height <= 0:
+                continue
+
+            matches = np.ones((height, width), dtype=bool)
+            for k, value in enumerate(data):
+                matches &= (
+                    _window(self.array, x0 + k * dx, y0 + k * dy, width, height)
+                    == value
+                )
+
+            count += int(np.count_nonzero(matches))
+
+        return count
+
+    def count_pattern(self, pattern: Sequence[str], wildcard: str = "?") -> int:
+        width = self.width - len(pattern[0]) + 1
+        height = self.height - len(pattern) + 1
+        if width <= 0 or height <= 0:
+            return 0
+
+        matches = np.ones((height, width), dtype=bool)
+        for dy, row in enumerate(pattern):
+            for dx, value in enumerate(row):
+                if value != wildcard:
+                    matches &= _window(self.array, dx, dy, width, height) == ord(value)
+
+        return int(np.count_nonzero(matches))
+
+
+FastGrid: type[Grid] = ArrayGrid if HAS_NUMPY else Grid
+"""The fastest grid implementation available: :class:`ArrayGrid` if NumPy is
+installed, :class:`Grid` otherwise."""
@@ -0,0 +1,194 @@
+"""
+An on-disk cache for the results of parsing puzzle inputs.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import io
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_DIR = Path(".aocutils") / "cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def fingerprint(value: Any) -> str:
+    """Gets a digest identifying the contents of ``value``.
+
+    Objects can provide their own digest through a ``fingerprint()`` method;
+    ``bytes``, ``str`` and iterables of them are hashed directly and anything else
+    is hashed through its pickled form. A ``fingerprint()`` method may raise
+    :class:`io.UnsupportedOperation` if the object cannot be identified (such as a
+    stream that was already read), in which case the result is not cached.
+    """
+    if hasattr(value, "fingerprint"):
+        return value.fingerprint()
+
+    digest = hashlib.sha256()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        digest.update(value)
+    elif isinstance(value, str):
+        digest.update(value.encode())
+    elif isinstance(value, (list, tuple)) and all(
+        isinstance(item, (bytes, str)) for item in value
+    ):
+        for item in value:
+            digest.update(item.encode() if isinstance(item, str) else item)
+            digest.update(b"\n")
+    else:
+        digest.update(pickle.dumps(value))
+
+    return digest.hexdigest()
+
+
+def _source_digest(func: Callable[..., Any]) -> str:
+    """Hashes the source of the module defining ``func``, so that changes to the
+    helpers it calls are also noticed."""
+    try:
+        source = Path(func.__code__.co_filename).read_bytes()
+    except OSError:
+        source = func.__code__.co_code
+
+    return hashlib.sha256(source).hexdigest()
+
+
+class ParseCache:
+    """A directory of pickled results, evicting the least recently used ones once
+    they take up more than ``max_bytes``.
+
+    Recency is tracked through the modification time of each entry.
+    """
+
+    def __init__(
+        self, root: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.pickle"
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        """Loads the entry at ``key``, returning whether it was found and its value.
+
+        Entries that can no longer be unpickled are treated as missing.
+        """
+        path = self._path(key)
+        try:
+            value = pickle.loads(path.read_bytes())
+        except FileNotFoundError:
+            return (False, None)
+        except Exception:
+            path.unlink(missing_ok=True)
+            return (False, None)
+
+        os.utime(path)
+        return (True, value)
+
+    def store(self, key: str, value: Any) -> bool:
+        """Stores ``value`` at ``key``, returning whether it could be pickled."""
+        try:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        if len(data) > self.max_bytes:
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        path = self._path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits in
+        ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.root.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted by another process meanwhile
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.root.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+def cached_parse(
+    func: Callable[..., T] | None = None,
+    *,
+    cache: ParseCache | None = None,
+) -> Any:
+    """Caches the results of a parsing function on disk.
+
+    Results are keyed by the function's qualified name, a hash of the source code
+    of its module and a fingerprint of its arguments (see :func:`fingerprint`), so
+    changing either the code or the input invalidates them. Each call returns a fresh
+    copy, so callers may mutate the result freely.
+
+    Can be used either as ``@cached_parse`` or ``@cached_parse(cache=...)``.
+    Caching is skipped if the ``AOCUTILS_NO_CACHE`` environment variable is set.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        prefix = f"{func.__module__}.{func.__qualname__}\0{_source_digest(func)}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if os.environ.get("AOCUTILS_NO_CACHE"):
+                return func(*args, **kwargs)
+
+            parse_cache = cache or ParseCache()
+
+            key_parts = [prefix]
+            try:
+                key_parts.extend(fingerprint(arg) for arg in args)
+                key_parts.extend(
+                    f"{name}={fingerprint(value)}"
+                    for name, value in sorted(kwargs.items())
+                )
+            except io.UnsupportedOperation:
+                # the input cannot be identified, so its result cannot be reused
+                return func(*args, **kwargs)
+
+            key = hashlib.sha256("\0".join(key_parts).encode()).hexdigest()
+
+            found, value = parse_cache.load(key)
+            if found:
+                return value
+
+            value = func(*args, **kwargs)
+            parse_cache.store(key, value)
+            return value
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
@@ -0,0 +1,157 @@
+"""
+Connected-component labeling for grids.
+
+A component is a group of cells holding the same value where each cell can be
+reached from any other by moving up, down, left or right within the group.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import NamedTuple
+
+from .grid import Bounds, Grid, Point
+
+
+class Component(NamedTuple):
+    """A connected component and its statistics.
+
+    ``area`` is the amount of cells in the component and ``perimeter`` is the amount
+    of cell sides that do not touch another cell of the component. ``corners`` is the
+    amount of corners (convex and concave) in its outline, which is also the amount
+    of straight sides the outline has.
+    """
+
+    label: int
+    value: str
+    area: int
+    perimeter: int
+    corners: int
+    bounds: Bounds
+
+
+class Components(NamedTuple):
+    """The result of labeling a grid.
+
+    ``labels`` holds the label of each cell in the same layout as :attr:`Grid.cells`
+    (anything between rows is labeled -1) and the component with label ``n`` is found
+    at ``components[n]``.
+    """
+
+    grid: Grid
+    labels: array
+    components: list[Component]
+
+    def label_at(self, point: Point) -> int:
+        """Returns the label of the component the cell at ``point`` belongs to."""
+        return self.labels[self.grid.index(point)]
+
+    def component_at(self, point: Point) -> Component:
+        """Returns the component the cell at ``point`` belongs to."""
+        return self.components[self.label_at(point)]
+
+
+def label_components(grid: Grid) -> Components:
+    """Labels every connected component in ``grid``.
+
+    Components are explored iteratively (no recursion limit applies) and each cell is
+    visited exactly once, so labeling runs in linear time.
+    """
+    width, height, stride = grid.width, grid.height, grid.stride
+
+    # a copy of the cells with a one-cell border holding a value not present in the
+    # grid, which lets neighbors be checked without bounds checks
+    values = set()
+    for row in grid.row_slices():
+        values.update(row)
+
+    unused = set(range(256)) - values
+    padded_width = width + 2
+    padded_size = padded_width * (height + 2)
+
+    padded: bytearray | array
+    if unused:
+        padded = bytearray([min(unused)]) * padded_size
+    else:
+        # every byte value is taken, so the copy is widened to hold one outside them
+        padded = array("h", [-1]) * padded_size
+
+    for y, row in enumerate(grid.row_slices()):
+        start = (y + 1) * padded_width + 1
+        padded[start : start + width] = row if unused else array("h", list(row))
+
+    labels = array("i", [-1]) * (stride * height)
+    components: list[Component] = []
+    stack: list[int] = []
+
+    for start in grid.indices():
+        if labels[start] != -1:
+            continue
+
+        label = len(components)
+        value = grid.cells[start]
+        labels[start] = label
+        stack.append(start)
+
+        area = perimeter = corners = 0
+        left, top = width, height
+        right = bottom = 0
+
+        while stack:
+            index = stack.pop()
+            y, x = divmod(index, stride)
+            pos = (y + 1) * padded_width + x + 1
+
+            area += 1
+            if x < left:
+                left = x
+            if x >= right:
+                right = x + 1
+            if y < top:
+                top = y
+            if y >= bottom:
+                bottom = y + 1
+
+            up = padded[pos - padded_width] == value
+            down = padded[pos + padded_width] == value
+            west = padded[pos - 1] == value
+            east = padded[pos + 1] == value
+
+            perimeter += 4 - (up + down + west + east)
+
+            # a corner is either convex (both sides are outside of the component) or
+            # concave (both sides are inside but the diagonal between them is not)
+            if up == west and (not up or padded[pos - padded_width - 1] != value):
+                corners += 1
+            if up == east and (not up or padded[pos - padded_width + 1] != value):
+                corners += 1
+            if down == west and (not down or padded[pos + padded_width - 1] != value):
+                corners += 1
+            if down == east and (not down or padded[pos + padded_width + 1] != value):
+                corners += 1
+
+            if up and labels[index - stride] == -1:
+                labels[index - stride] = label
+                stack.append(index - stride)
+            if down and labels[index + stride] == -1:
+                labels[index + stride] = label
+                stack.append(index + stride)
+            if west and labels[index - 1] == -1:
+                labels[index - 1] = label
+                stack.append(index - 1)
+            if east and labels[index + 1] == -1:
+                labels[index + 1] = label
+                stack.append(index + 1)
+
+        components.append(
+            Component(
+                label,
+                chr(value),
+                area,
+                perimeter,
+                corners,
+                Bounds(left, top, right, bottom),
+            )
+        )
+
+    return Components(grid, labels, components)
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+# Packed points store each coordinate as an unsigned 32-bit field, offset so that
+# negative coordinates can also be represented.
+_PACK_BITS = 32
+_PACK_MASK = (1 << _PACK_BITS) - 1
+_PACK_OFFSET = 1 << (_PACK_BITS - 1)
+
+# skips the Python-level __new__ generated for Point when making points internally
+_new_point = tuple.__new__
 
 
 def wrap(value: int, minimum: int, maximum: int) -> int:
@@ -17,25 +31,63 @@ def wrap_point(point: Point, xval: tuple[int, int], yval: tuple[int, int]) -> Po
     return Point(wrap(point.x, *xval), wrap(point.y, *yval))
 
 
-@dataclass(frozen=True, order=True)
-class Point:
+def pack_point(x: int, y: int) -> int:
+    """Packs the coordinates (x, y) into a single integer for use as a set or dict key.
+
+    Both coordinates must satisfy ``-2**31 <= value < 2**31``. Packed points sort in
+    reading order (by y, then by x) and moving one column or row only requires adding
+    ``1`` or ``2**32`` to the key respectively.
+    """
+    return ((y + _PACK_OFFSET) << _PACK_BITS) | (x + _PACK_OFFSET)
+
+
+def unpack_point(key: int) -> Point:
+    """Returns the point packed into ``key`` by :func:`pack_point`."""
+    return _new_point(
+        Point, ((key & _PACK_MASK) - _PACK_OFFSET, (key >> _PACK_BITS) - _PACK_OFFSET)
+    )
+
+
+class Point(NamedTuple):
     x: int
     y: int
 
-    def __add__(self, other: Point) -> Point:
-        return Point(self.x + other.x, self.y + other.y)
+    def __add__(self, other: Point) -> Point:  # type: ignore[override]
+        return _new_point(Point, (self[0] + other[0], self[1] + other[1]))
+
+    def pack(self) -> int:
+        """Returns this point packed into a single integer (see :func:`pack_point`)."""
+        return ((self[1] + _PACK_OFFSET) << _PACK_BITS) | (self[0] + _PACK_OFFSET)
+
+
+# (dx, dy) offsets to the neighbors of a cell, in the order top, bottom, left, right
+# and then top left, top right, bottom left, bottom right.
+OFFSETS4 = ((0, -1), (0, 1), (-1, 0), (1, 0))
+OFFSETS8 = OFFSETS4 + ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+
+class Bounds(NamedTuple):
+    """A bounding box. ``right`` and ``bottom`` are exclusive."""
+
+    left: int
+    top: int
+    right: int
+    bottom: int
 
 
 class Cell:
+    __slots__ = ("grid", "point")
+
     def __init__(self, grid: Grid, point: Point) -> None:
         self.grid = grid
         self.point = point
 
     def __str__(self) -> str:
-        return self.grid.space[self.point.y][self.point.x]
+        return self.grid.get(self.point)
 
     def _bound_move(self, dx: int, dy: int) -> Cell | None:
-        new_position = self.point + Point(dx, dy)
+        x, y = self.point
+        new_position = _new_point(Point, (x + dx, y + dy))
         if self.grid.is_valid(new_position):
             return Cell(self.grid, new_position)
 
@@ -72,25 +124,386 @@ class Cell:
         return self._bound_move(1, 1)
 
 
-class Grid:
-    def __init__(self, width: int, height: int) -> None:
-        super().__init__()
+class Cursor:
+    """A movable reference to a cell in a grid.
+
+    Unlike :class:`Cell`, a cursor is moved in place so walking around a grid does
+    not create a new object per step.
+    """
+
+    __slots__ = ("grid", "index", "x", "y")
+
+    def __init__(self, grid: Grid, point: Point) -> None:
+        self.grid = grid
+        self.move_to(point)
 
-        self.space = [list(" " * width) for _ in range(height)]
+    @property
+    def point(self) -> Point:
+        """The point the cursor is currently at."""
+        return _new_point(Point, (self.x, self.y))
 
     @property
-    def width(self) -> int:
-        return len(self.space[0])
+    def value(self) -> str:
+        """The value of the cell the cursor is currently at."""
+        return chr(self.grid.cells[self.index])
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self.grid.cells[self.index] = ord(value)
+
+    def move_to(self, point: Point) -> None:
+        """Moves the cursor to ``point``."""
+        self.x, self.y = point
+        self.index = self.grid.index(point)
+
+    def can_move(self, dx: int, dy: int) -> bool:
+        """Returns whether moving by (dx, dy) keeps the cursor within the grid."""
+        grid = self.grid
+        return 0 <= self.x + dx < grid.width and 0 <= self.y + dy < grid.height
+
+    def move(self, dx: int, dy: int) -> bool:
+        """Moves the cursor by (dx, dy). If that would leave the grid, the cursor is
+        not moved.
+
+        Returns whether the cursor was moved.
+        """
+        if not self.can_move(dx, dy):
+            return False
+
+        self.x += dx
+        self.y += dy
+        self.index += dy * self.grid.stride + dx
+        return True
+
+    def peek(self, dx: int, dy: int) -> str | None:
+        """Returns the value of the cell at an offset of (dx, dy) from the cursor, or
+        None if that cell is outside the grid."""
+        if not self.can_move(dx, dy):
+            return None
+
+        return chr(self.grid.cells[self.index + dy * self.grid.stride + dx])
+
+
+class Grid:
+    """A grid of single-character cells with a fixed width and height.
+
+    Cells are stored row by row in a single buffer (usually a ``bytearray``), where
+    the cell at (x, y) is found at index ``y * stride + x``. The stride is normally
+    the width of the grid, but may be larger for grids viewing data whose rows are
+    separated (e.g. by newlines, see :meth:`from_mmap`). Cell values must be
+    single-byte (ASCII) characters.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fill: str = " ",
+        *,
+        cells: bytearray | None = None,
+        stride: int | None = None,
+    ) -> None:
+        """
+        Arguments:
+            width (int), height (int):
+                The dimensions of the grid.
+
+            fill (str, optional):
+                The value every cell initially holds. Defaults to a space.
+
+            cells (bytearray, optional):
+                The cells of the grid, in the layout described above. If provided,
+                ``fill`` is ignored and the buffer is used as is (not copied).
+
+            stride (int, optional):
+                The distance between the start of two rows in ``cells``. Defaults
+                to ``width``.
+        """
+        stride = width if stride is None else stride
+        if stride < width:
+            raise ValueError("The stride of a grid cannot be less than its width.")
+
+        if cells is None:
+            cells = bytearray(fill.encode("ascii") * (stride * height))
+        elif height and len(cells) < (height - 1) * stride + width:
+            raise ValueError(f"Expected {height} rows of {width} cells in buffer.")
+
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self.cells = cells
+
+        # offsets to the neighbors of a cell in cells, in the order of OFFSETS8
+        self.index_offsets = tuple(dy * stride + dx for dx, dy in OFFSETS8)
+        self._index_offsets4 = self.index_offsets[:4]
+        # the same with the directions they go in, for bounds checks
+        self._neighbor_table8 = tuple(
+            (dx, dy, offset) for (dx, dy), offset in zip(OFFSETS8, self.index_offsets)
+        )
+        self._neighbor_table4 = self._neighbor_table8[:4]
+
+    @staticmethod
+    def _layout(data: bytes | mmap) -> tuple[int, int, int]:
+        """Returns the (width, height, stride) of the rows separated by newlines (LF
+        or CRLF) in ``data``, where a trailing newline is optional."""
+        width = data.find(b"\n")
+        if width == -1:
+            return len(data), 1 if data else 0, len(data) + 1
+
+        separator = 1
+        if width > 0 and data[width - 1] == ord("\r"):
+            width, separator = width - 1, 2
+
+        stride = width + separator
+        height = (len(data) + separator) // stride
+
+        if len(data) not in (height * stride, height * stride - separator):
+            raise ValueError("All rows in a grid must be of the same length.")
+
+        return width, height, stride
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> Grid:
+        """Creates a grid from ``lines``, each line being a row of the grid.
+
+        All lines must be of the same length.
+        """
+        rows = list(lines)
+        width = len(rows[0]) if rows else 0
+
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows in a grid must be of the same length.")
+
+        return cls(width, len(rows), cells=bytearray("".join(rows), "ascii"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Grid:
+        """Creates a grid from ``data``, a sequence of rows separated by newlines
+        (either LF or CRLF). A trailing newline is optional.
+
+        All rows must be of the same length.
+        """
+        width, height, stride = cls._layout(data)
+        cells = bytearray(width * height)
+
+        view = memoryview(data)
+        for y in range(height):
+            start = y * stride
+            cells[y * width : (y + 1) * width] = view[start : start + width]
+
+        return cls(width, height, cells=cells)
+
+    @classmethod
+    def from_mmap(cls, data: mmap) -> Grid:
+        """Creates a grid viewing ``data``, a memory map of rows separated by newlines
+        (either LF or CRLF). A trailing newline is optional.
+
+        The grid reads and writes ``data`` directly, without copying it. For the grid
+        to be writable, the map must have been created with write or copy access
+        (``mmap.ACCESS_WRITE`` or ``mmap.ACCESS_COPY``).
+
+        All rows must be of the same length.
+        """
+        width, height, stride = cls._layout(data)
+
+        newline = ord("\n")
+        for y in range(height - 1):
+            if data[y * stride + stride - 1] != newline:
+                raise ValueError("All rows in a grid must be of the same length.")
+
+        return cls(width, height, cells=data, stride=stride)
 
     @property
-    def height(self) -> int:
-        return len(self.space)
+    def is_compact(self) -> bool:
+        """Whether :attr:`cells` is a ``bytearray`` holding nothing but the cells of
+        the grid."""
+        return self.stride == self.width and isinstance(self.cells, bytearray)
+
+    def row_slices(self) -> Iterator[bytes]:
+        """Yields a copy of each row of the grid, from top to bottom."""
+        cells, width, stride = self.cells, self.width, self.stride
+        for y in range(self.height):
+            yield cells[y * stride : y * stride + width]
+
+    def copy(self) -> Grid:
+        """Returns a copy of this grid. The copy is always compact."""
+        if self.is_compact:
+            cells = self.cells[:]
+        else:
+            cells = bytearray().join(self.row_slices())
+
+        return type(self)(self.width, self.height, cells=cells)
+
+    def index(self, point: Point) -> int:
+        """Returns the position of ``point`` in :attr:`cells`."""
+        return point.y * self.stride + point.x
+
+    def point(self, index: int) -> Point:
+        """Returns the point at position ``index`` of :attr:`cells`."""
+        y, x = divmod(index, self.stride)
+        return Point(x, y)
+
+    def indices(self) -> Iterator[int]:
+        """Yields the index of every cell in the grid in reading order."""
+        if self.stride == self.width:
+            return iter(range(self.width * self.height))
+
+        return (
+            index
+            for start in range(0, self.height * self.stride, self.stride)
+            for index in range(start, start + self.width)
+        )
 
     def at(self, point: Point) -> Cell:
         return Cell(self, point)
 
+    def cursor(self, point: Point) -> Cursor:
+        """Returns a :class:`Cursor` placed at ``point``."""
+        return Cursor(self, point)
+
+    def is_interior(self, index: int) -> bool:
+        """Returns whether the cell at ``index`` has all 8 of its neighbors within
+        the grid."""
+        y, x = divmod(index, self.stride)
+        return 0 < x < self.width - 1 and 0 < y < self.height - 1
+
+    def _neighbors(
+        self, index: int, table: tuple[tuple[int, int, int], ...]
+    ) -> Iterator[int]:
+        y, x = divmod(index, self.stride)
+        width, height = self.width, self.height
+
+        for dx, dy, offset in table:
+            if 0 <= x + dx < width and 0 <= y + dy < height:
+                yield index + offset
+
+    def neighbors4(self, index: int) -> Iterator[int]:
+        """Yields the indices of the cells orthogonally adjacent to the cell at
+        ``index`` that are within the grid, in the order of :data:`OFFSETS4`."""
+        return self._neighbors(index, self._neighbor_table4)
+
+    def neighbors8(self, index: int) -> Iterator[int]:
+        """Yields the indices of the cells orthogonally or diagonally adjacent to the
+        cell at ``index`` that are within the grid, in the order of :data:`OFFSETS8`."""
+        return self._neighbors(index, self._neighbor_table8)
+
+    def neighbors4_unchecked(self, index: int) -> Iterator[int]:
+        """Like :meth:`neighbors4`, but without checking whether the neighbors are in
+        the grid. Only valid for cells where :meth:`is_interior` is True."""
+        return map(index.__add__, self._index_offsets4)
+
+    def neighbors8_unchecked(self, index: int) -> Iterator[int]:
+        """Like :meth:`neighbors8`, but without checking whether the neighbors are in
+        the grid. Only valid for cells where :meth:`is_interior` is True."""
+        return map(index.__add__, self.index_offsets)
+
+    def get(self, point: Point) -> str:
+        """Returns the value of the cell at ``point``."""
+        return chr(self.cells[point.y * self.stride + point.x])
+
     def put(self, point: Point, value: str) -> None:
-        self.space[point.y][point.x] = value
+        self.cells[point.y * self.stride + point.x] = ord(value)
+
+    def find(self, value: str) -> Point | None:
+        """Returns the first point (in reading order) whose value is ``value``, or
+        None if no such point exists."""
+        index = next(self.find_all(value), None)
+        if index is None:
+            return None
+
+        return self.point(index)
+
+    def find_all(self, value: str) -> Iterator[int]:
+        """Yields the index of every cell whose value is ``value`` in reading order."""
+        cells, target = self.cells, value.encode("ascii")
+        width, stride = self.width, self.stride
+
+        index = cells.find(target)
+        while index != -1:
+            # skip whatever separates the rows
+            if index % stride < width:
+                yield index
+            index = cells.find(target, index + 1)
+
+    def count(self, value: str) -> int:
+        """Returns the amount of cells whose value is ``value``."""
+        if self.is_compact:
+            return self.cells.count(ord(value))
+
+        return sum(row.count(ord(value)) for row in self.row_slices())
+
+    def counts(self) -> dict[str, int]:
+        """Returns a mapping of each value in the grid to the amount of cells with it."""
+        if self.is_compact:
+            frequencies = Counter(self.cells)
+        else:
+            frequencies = Counter()
+            for row in self.row_slices():
+                frequencies.update(row)
+
+        return {chr(value): count for value, count in frequencies.items()}
+
+    def count_word(
+        self, word: str, directions: Iterable[tuple[int, int]] = OFFSETS8
+    ) -> int:
+        """Returns the amount of times ``word`` can be read in the grid.
+
+        A word is read starting from any cell and moving in a straight line along one
+        of ``directions``, given as (dx, dy) offsets. By default, all 8 directions
+        (including backwards and diagonals) are considered.
+        """
+        if not word:
+            raise ValueError("Cannot count an empty word.")
+
+        data = word.encode("ascii")
+        last = len(data) - 1
+        width, height, stride, cells = self.width, self.height, self.stride, self.cells
+
+        count = 0
+        for dx, dy in directions:
+            offset = dy * stride + dx
+            steps = [(k * offset, data[k]) for k in range(1, len(data))]
+
+            for index in self.find_all(word[0]):
+                y, x = divmod(index, stride)
+                if not (0 <= x + dx * last < width and 0 <= y + dy * last < height):
+                    continue
+
+                if all(cells[index + step] == value for step, value in steps):
+                    count += 1
+
+        return count
+
+    def count_pattern(self, pattern: Sequence[str], wildcard: str = "?") -> int:
+        """Returns the amount of times the rectangular ``pattern`` appears in the grid.
+
+        ``pattern`` is a list of rows. A cell in ``pattern`` matches a cell in the
+        grid if both have the same value or if the pattern cell is ``wildcard``.
+        """
+        pattern_height, pattern_width = len(pattern), len(pattern[0])
+        width, stride, cells = self.width, self.stride, self.cells
+
+        checks = [
+            (dy * stride + dx, ord(value))
+            for dy, row in enumerate(pattern)
+            for dx, value in enumerate(row)
+            if value != wildcard
+        ]
+
+        count = 0
+        for y in range(self.height - pattern_height + 1):
+            for index in range(y * stride, y * stride + width - pattern_width + 1):
+                if all(cells[index + offset] == value for offset, value in checks):
+                    count += 1
+
+        return count
+
+    def rows(self) -> list[str]:
+        """Returns the rows of this grid as strings."""
+        return [row.decode("ascii") for row in self.row_slices()]
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
 
     def is_valid(self, point: Point) -> bool:
         return 0 <= point.x < self.width and 0 <= point.y < self.height
@@ -0,0 +1,115 @@
+"""
+Memory-mapped access to (possibly very large) input files.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import stat
+from collections.abc import Iterator
+from typing import IO
+
+from .grid import Grid
+
+
+class MappedFile:
+    """A memory map of a file, giving access to its contents without reading it
+    into memory up front.
+
+    The file is mapped with copy-on-write access, so changes made through the map
+    (for example, by a grid from :meth:`grid`) are never written back to the file.
+
+    Views returned by :meth:`view` and :meth:`lines` reference the map directly, so
+    they must be released before the file is closed.
+
+    Only regular files can be mapped. Anything else (such as a pipe or a terminal)
+    is read into memory instead.
+    """
+
+    def __init__(self, file: str | os.PathLike[str] | IO | int) -> None:
+        """
+        Arguments:
+            file (str | PathLike | IO | int):
+                The path of the file to map, a file object opened for reading (such
+                as the ``input_file`` returned by ``aocgen.get_user_input``) or a
+                file descriptor (such as ``PuzzleInput.fileno()``).
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as fp:
+                self.data = self._map(fp.fileno())
+        elif isinstance(file, int):
+            self.data = self._map(file)
+        elif not stat.S_ISREG(os.fstat(file.fileno()).st_mode):
+            # read through the file object, which may hold data it has buffered
+            data = getattr(file, "buffer", file).read()
+            self.data = bytearray(data)
+        else:
+            self.data = self._map(file.fileno())
+
+        self._view: memoryview | None = None
+
+    @staticmethod
+    def _map(fileno: int) -> mmap.mmap | bytearray:
+        status = os.fstat(fileno)
+        if not stat.S_ISREG(status.st_mode):
+            chunks = []
+            while chunk := os.read(fileno, 1 << 16):
+                chunks.append(chunk)
+            return bytearray().join(chunks)
+
+        # empty files cannot be mapped
+        if status.st_size == 0:
+            return bytearray()
+
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_COPY)
+
+    def __enter__(self) -> MappedFile:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def close(self) -> None:
+        """Unmaps the file. Any grid or view created from it can no longer be used."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def view(self) -> memoryview:
+        """Returns a view of the whole file."""
+        if self._view is None:
+            self._view = memoryview(self.data)
+
+        return self._view
+
+    def lines(self) -> Iterator[memoryview]:
+        """Yields a view of each line in the file, without its line ending (either LF
+        or CRLF). Lines are only decoded if the caller does so."""
+        data, view = self.data, self.view()
+        start, end = 0, len(data)
+
+        while start < end:
+            newline = data.find(b"\n", start)
+            stop = end if newline == -1 else newline
+
+            if stop > start and data[stop - 1] == ord("\r"):
+                yield view[start : stop - 1]
+            else:
+                yield view[start:stop]
+
+            start = stop + 1
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Returns the contents of the file decoded using ``encoding``."""
+        return str(self.view(), encoding)
+
+    def grid(self) -> Grid:
+        """Returns a grid viewing the file in place (see :meth:`Grid.from_mmap`)."""
+        return Grid.from_mmap(self.data)
@@ -0,0 +1,219 @@
+"""
+Batches of points stored as a struct of arrays, for simulating many points at once.
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from itertools import repeat
+from typing import Any
+
+from .grid import Bounds, Point
+
+# NumPy is imported on first use (see _import_numpy) so that importing aocutils
+# does not pay for it
+np: Any = None
+_numpy_missing = False
+
+# the NumPy ufuncs equivalent to the operators used by PointArray._apply
+_UFUNC_NAMES = {operator.add: "add", operator.mul: "multiply", operator.mod: "mod"}
+
+
+def _import_numpy() -> Any:
+    """Imports NumPy if it is installed, returning the module or None."""
+    global np, _numpy_missing
+
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            _numpy_missing = True
+        else:
+            np = numpy
+
+    return np
+
+
+class PointArray:
+    """A sequence of points whose x and y coordinates are kept in two parallel arrays.
+
+    The coordinates are stored in ``array('q')`` buffers, or in ``int64`` NumPy arrays
+    if NumPy is installed (and ``use_numpy`` is not False). Batch operations update
+    every point in place without creating a :class:`Point` per point.
+    """
+
+    def __init__(
+        self,
+        xs: Iterable[int] = (),
+        ys: Iterable[int] = (),
+        *,
+        use_numpy: bool | None = None,
+    ) -> None:
+        numpy = _import_numpy() if use_numpy is not False else None
+        if use_numpy and numpy is None:
+            raise ImportError("NumPy is not installed.")
+
+        self.use_numpy = numpy is not None
+        if self.use_numpy:
+            self.xs = np.fromiter(xs, dtype=np.int64)
+            self.ys = np.fromiter(ys, dtype=np.int64)
+        else:
+            self.xs = array("q", xs)
+            self.ys = array("q", ys)
+
+        if len(self.xs) != len(self.ys):
+            raise ValueError("Both coordinate arrays must be of the same length.")
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[Point], *, use_numpy: bool | None = None
+    ) -> PointArray:
+        """Creates a point array from ``points``."""
+        points = list(points)
+        return cls(
+            (point.x for point in points),
+            (point.y for point in points),
+            use_numpy=use_numpy,
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index: int) -> Point:
+        return Point(int(self.xs[index]), int(self.ys[index]))
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, map(int, self.xs), map(int, self.ys))
+
+    def copy(self) -> PointArray:
+        """Returns a copy of this point array."""
+        copied = PointArray.__new__(PointArray)
+        copied.use_numpy = self.use_numpy
+        if self.use_numpy:
+            # slicing a NumPy array gives a view, not a copy
+            copied.xs, copied.ys = self.xs.copy(), self.ys.copy()
+        else:
+            copied.xs, copied.ys = self.xs[:], self.ys[:]
+        return copied
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # unpickling NumPy arrays imports NumPy without going through _import_numpy
+        if state["use_numpy"]:
+            _import_numpy()
+        self.__dict__.update(state)
+
+    def _apply(
+        self, function: Callable[[int, int], int], x_operand: Any, y_operand: Any
+    ) -> None:
+        # applies ``function`` to each coordinate and an operand, being either a single
+        # value or a sequence of values (one per point)
+        if self.use_numpy:
+            # writing into the existing arrays avoids allocating new ones each time
+            ufunc = getattr(np, _UFUNC_NAMES[function])
+            ufunc(self.xs, x_operand, out=self.xs)
+            ufunc(self.ys, y_operand, out=self.ys)
+            return
+
+        if isinstance(x_operand, int):
+            x_operand, y_operand = repeat(x_operand), repeat(y_operand)
+
+        self.xs = array("q", map(function, self.xs, x_operand))
+        self.ys = array("q", map(function, self.ys, y_operand))
+
+    def add(self, other: Point | PointArray, times: int = 1) -> PointArray:
+        """Adds ``other`` multiplied by ``times`` to every point in place. ``other`` is
+        either a single point or a point array with one point per point.
+
+        Returns this point array.
+        """
+        if isinstance(other, PointArray):
+            if times != 1:
+                other = other.copy().scale(times)
+            dxs, dys = other.xs, other.ys
+        else:
+            dxs, dys = other.x * times, other.y * times
+
+        self._apply(operator.add, dxs, dys)
+        return self
+
+    def scale(self, factor: int) -> PointArray:
+        """Multiplies every coordinate by ``factor`` in place. Returns this point
+        array."""
+        self._apply(operator.mul, factor, factor)
+        return self
+
+    def wrap(self, width: int, height: int) -> PointArray:
+        """Wraps every point in place so that ``0 <= x < width`` and
+        ``0 <= y < height``. Returns this point array."""
+        self._apply(operator.mod, width, height)
+        return self
+
+    def bounds(self) -> Bounds:
+        """Returns the smallest box containing every point. The array must not be
+        empty."""
+        return Bounds(
+            int(min(self.xs)),
+            int(min(self.ys)),
+            int(max(self.xs)) + 1,
+            int(max(self.ys)) + 1,
+        )
+
+    def histogram(self, width: int, height: int) -> list[int]:
+        """Returns the amount of points at each position of a ``width`` by ``height``
+        area, where the count for (x, y) is at index ``y * width + x``.
+
+        Every point must be within the area.
+        """
+        if self.use_numpy:
+            indices = self.ys * width + self.xs
+            return np.bincount(indices, minlength=width * height).tolist()
+
+        counts = [0] * (width * height)
+        for x, y in zip(self.xs, self.ys):
+            counts[y * width + x] += 1
+
+        return counts
+
+    def occupancy(self, width: int, height: int) -> bytearray:
+        """Returns a ``width`` by ``height`` map (laid out like :meth:`histogram`)
+        holding 1 where there is at least one point and 0 elsewhere.
+
+        Every point must be within the area.
+        """
+        if self.use_numpy:
+            occupied = np.zeros(width * height, dtype=np.uint8)
+            occupied[self.ys * width + self.xs] = 1
+            return bytearray(occupied.tobytes())
+
+        occupied = bytearray(width * height)
+        for x, y in zip(self.xs, self.ys):
+            occupied[y * width + x] = 1
+
+        return occupied
+
+    def quadrant_counts(self, width: int, height: int) -> tuple[int, int, int, int]:
+        """Returns the amount of points in each quadrant of a ``width`` by ``height``
+        area, in the order top left, top right, bottom left and bottom right.
+
+        Points on the middle row or column of the area do not belong to any quadrant.
+        """
+        x_axis, y_axis = width // 2, height // 2
+
+        if self.use_numpy:
+            left, right = self.xs < x_axis, self.xs > x_axis
+            top, bottom = self.ys < y_axis, self.ys > y_axis
+            return (
+                int(np.count_nonzero(top & left)),
+                int(np.count_nonzero(top & right)),
+                int(np.count_nonzero(bottom & left)),
+                int(np.count_nonzero(bottom & right)),
+            )
+
+        counts = [0, 0, 0, 0]
+        for x, y in zip(self.xs, self.ys):
+            if x != x_axis and y != y_axis:
+                counts[(y > y_axis) * 2 + (x > x_axis)] += 1
+
+        return (counts[0], counts[1], counts[2], counts[3])
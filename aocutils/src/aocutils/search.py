@@ -0,0 +1,346 @@
+"""
+Path searching (BFS, Dijkstra and A*) over grids and implicit graphs.
+
+States are plain integers. When searching a :class:`Grid`, a state is the index of
+a cell (see :meth:`Grid.index`) and walls are skipped. Any other graph is given as a
+function returning the neighbors of a state. If the amount of states is known up
+front (``size``), visited states and costs are kept in flat arrays instead of sets
+and dicts.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from .grid import Grid
+
+Neighbors = Callable[[int], Iterable[int]]
+WeightedNeighbors = Callable[[int], Iterable[tuple[int, int]]]
+Goal = int | Callable[[int], bool] | None
+
+# the cost of a state that has not been reached yet
+_INFINITY = (1 << 63) - 1
+
+
+class _StateSet(set):
+    """A set of states that can be used in place of a ``bytearray`` of flags."""
+
+    __getitem__ = set.__contains__
+
+    def __setitem__(self, state: int, flag: int) -> None:
+        if flag:
+            self.add(state)
+        else:
+            self.discard(state)
+
+
+class _StateMap(dict):
+    """A mapping of states to values that can be used in place of an ``array``."""
+
+    def __init__(self, default: int) -> None:
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, state: int) -> int:
+        return self.default
+
+
+def _flags(size: int | None) -> bytearray | _StateSet:
+    return bytearray(size) if size is not None else _StateSet()
+
+
+def _values(size: int | None, default: int) -> array | _StateMap:
+    return array("q", [default]) * size if size is not None else _StateMap(default)
+
+
+class SearchResult(NamedTuple):
+    """The result of a search.
+
+    ``goal`` is the goal state reached (None if no goal was given or it could not be
+    reached) and ``cost`` is the cost of reaching it. ``visited`` has a truthy entry
+    for every state explored and ``parents`` maps each state to the one it was reached
+    from, if paths were tracked.
+    """
+
+    goal: int | None
+    cost: int | None
+    visited: bytearray | set[int]
+    parents: array | dict[int, int] | None
+
+    def path(self, target: int | None = None) -> list[int]:
+        """Returns the states on the path from a source to ``target`` (by default, the
+        goal reached), both ends included.
+
+        The search must have been run with ``track_path=True``.
+        """
+        if self.parents is None:
+            raise ValueError("Paths are only available if track_path=True was given.")
+
+        if target is None:
+            target = self.goal
+        if target is None or not self.visited[target]:
+            raise ValueError("The target was not reached.")
+
+        path = [target]
+        while (target := self.parents[target]) != -1:
+            path.append(target)
+
+        path.reverse()
+        return path
+
+
+def grid_neighbors(grid: Grid, walls: str = "#") -> Neighbors:
+    """Returns a function giving the indices of the cells adjacent to a cell in
+    ``grid`` (up, down, left and right) that are not one of ``walls``."""
+    table = bytes(chr(value) not in walls for value in range(256))
+    width, stride = grid.width, grid.stride
+
+    if grid.is_compact:
+        passable = grid.cells.translate(table)
+    else:
+        # anything between rows stays impassable
+        passable = bytearray(stride * grid.height)
+        for y, row in enumerate(grid.row_slices()):
+            passable[y * stride : y * stride + width] = row.translate(table)
+
+    size = len(passable)
+
+    def neighbors(index: int) -> list[int]:
+        found = []
+        x = index % stride
+        if index >= stride and passable[index - stride]:
+            found.append(index - stride)
+        if index + stride < size and passable[index + stride]:
+            found.append(index + stride)
+        if x and passable[index - 1]:
+            found.append(index - 1)
+        if x + 1 < width and passable[index + 1]:
+            found.append(index + 1)
+        return found
+
+    return neighbors
+
+
+def _goal_test(goal: Goal) -> Callable[[int], bool] | None:
+    if goal is None or callable(goal):
+        return goal
+
+    return goal.__eq__
+
+
+def _resolve(
+    graph: Grid | Neighbors, walls: str, size: int | None
+) -> tuple[Neighbors, int | None]:
+    if isinstance(graph, Grid):
+        return grid_neighbors(graph, walls), graph.stride * graph.height
+
+    return graph, size
+
+
+def multi_source_bfs(
+    graph: Grid | Neighbors,
+    starts: Iterable[int],
+    goal: Goal = None,
+    *,
+    walls: str = "#",
+    size: int | None = None,
+    track_path: bool = False,
+) -> SearchResult:
+    """Runs a breadth-first search from all of ``starts`` at once.
+
+    Arguments:
+        graph (Grid | Callable[[int], Iterable[int]]):
+            The grid to search or a function returning the neighbors of a state.
+
+        starts (Iterable[int]):
+            The states to start from, all of which have a cost of 0.
+
+        goal (int | Callable[[int], bool], optional):
+            The state to search for, or a function returning whether a state is a goal.
+            If not given, every reachable state is visited.
+
+        walls (str, optional):
+            When searching a grid, the values of the cells that cannot be entered.
+
+        size (int, optional):
+            When searching a function, the amount of states, which must be numbered
+            from 0 to ``size - 1``. If not given, states may be any integer.
+
+        track_path (bool, optional):
+            Whether to record how each state was reached so :meth:`SearchResult.path`
+            can be used. Defaults to False.
+    """
+    neighbors, size = _resolve(graph, walls, size)
+    is_goal = _goal_test(goal)
+
+    visited = _flags(size)
+    parents = _values(size, -1) if track_path else None
+
+    frontier = []
+    for start in starts:
+        if not visited[start]:
+            visited[start] = 1
+            frontier.append(start)
+
+    cost = 0
+    while frontier:
+        next_frontier = []
+        for state in frontier:
+            if is_goal is not None and is_goal(state):
+                return SearchResult(state, cost, visited, parents)
+
+            for neighbor in neighbors(state):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    next_frontier.append(neighbor)
+                    if parents is not None:
+                        parents[neighbor] = state
+
+        frontier = next_frontier
+        cost += 1
+
+    return SearchResult(None, None, visited, parents)
+
+
+def bfs(
+    graph: Grid | Neighbors,
+    start: int,
+    goal: Goal = None,
+    *,
+    walls: str = "#",
+    size: int | None = None,
+    track_path: bool = False,
+) -> SearchResult:
+    """Runs a breadth-first search from ``start``. See :func:`multi_source_bfs`."""
+    return multi_source_bfs(
+        graph, (start,), goal, walls=walls, size=size, track_path=track_path
+    )
+
+
+def _best_first(
+    neighbors: WeightedNeighbors,
+    size: int | None,
+    starts: Iterable[int],
+    is_goal: Callable[[int], bool] | None,
+    heuristic: Callable[[int], int] | None,
+    track_path: bool,
+) -> SearchResult:
+    closed = _flags(size)
+    best = _values(size, _INFINITY)
+    parents = _values(size, -1) if track_path else None
+
+    # entries are (estimate, -cost, state) so ties favor states further along
+    heap = []
+    for start in starts:
+        best[start] = 0
+        heap.append((heuristic(start) if heuristic else 0, 0, start))
+    heapq.heapify(heap)
+
+    while heap:
+        _, cost, state = heapq.heappop(heap)
+        cost = -cost
+        if closed[state]:
+            continue
+
+        closed[state] = 1
+        if is_goal is not None and is_goal(state):
+            return SearchResult(state, cost, closed, parents)
+
+        for neighbor, step in neighbors(state):
+            new_cost = cost + step
+            if new_cost < best[neighbor]:
+                best[neighbor] = new_cost
+                if parents is not None:
+                    parents[neighbor] = state
+
+                estimate = new_cost + heuristic(neighbor) if heuristic else new_cost
+                heapq.heappush(heap, (estimate, -new_cost, neighbor))
+
+    return SearchResult(None, None, closed, parents)
+
+
+def _weighted(
+    graph: Grid | WeightedNeighbors,
+    walls: str,
+    weight: Callable[[int, int], int] | None,
+    size: int | None,
+) -> tuple[WeightedNeighbors, int | None]:
+    if not isinstance(graph, Grid):
+        return graph, size
+
+    neighbors = grid_neighbors(graph, walls)
+
+    def weighted_neighbors(index: int) -> list[tuple[int, int]]:
+        if weight is None:
+            return [(neighbor, 1) for neighbor in neighbors(index)]
+
+        return [(neighbor, weight(index, neighbor)) for neighbor in neighbors(index)]
+
+    return weighted_neighbors, graph.stride * graph.height
+
+
+def _starts(start: int | Iterable[int]) -> Iterable[int]:
+    return (start,) if isinstance(start, int) else start
+
+
+def dijkstra(
+    graph: Grid | WeightedNeighbors,
+    start: int | Iterable[int],
+    goal: Goal = None,
+    *,
+    weight: Callable[[int, int], int] | None = None,
+    walls: str = "#",
+    size: int | None = None,
+    track_path: bool = False,
+) -> SearchResult:
+    """Runs Dijkstra's algorithm from ``start`` (a state or several states).
+
+    ``graph`` is either a grid or a function returning pairs of (neighbor, cost) for a
+    state. When searching a grid, ``weight`` returns the cost of moving between two
+    adjacent cells (1 by default). Costs must be non-negative integers.
+
+    The other arguments are the same as in :func:`multi_source_bfs`.
+    """
+    neighbors, size = _weighted(graph, walls, weight, size)
+    return _best_first(
+        neighbors, size, _starts(start), _goal_test(goal), None, track_path
+    )
+
+
+def astar(
+    graph: Grid | WeightedNeighbors,
+    start: int | Iterable[int],
+    goal: Goal,
+    heuristic: Callable[[int], int] | None = None,
+    *,
+    weight: Callable[[int, int], int] | None = None,
+    walls: str = "#",
+    size: int | None = None,
+    track_path: bool = False,
+) -> SearchResult:
+    """Runs an A* search from ``start`` (a state or several states) towards ``goal``.
+
+    ``heuristic`` estimates the remaining cost from a state to the goal and must never
+    overestimate it. When searching a grid for a single goal cell, it defaults to the
+    Manhattan distance (which requires every move to cost at least 1).
+
+    The other arguments are the same as in :func:`dijkstra`.
+    """
+    if heuristic is None:
+        if not isinstance(graph, Grid) or not isinstance(goal, int):
+            raise ValueError("A heuristic is required unless searching a grid cell.")
+
+        stride = graph.stride
+        goal_y, goal_x = divmod(goal, stride)
+
+        def heuristic(index: int) -> int:
+            y, x = divmod(index, stride)
+            return abs(x - goal_x) + abs(y - goal_y)
+
+    neighbors, size = _weighted(graph, walls, weight, size)
+    return _best_first(
+        neighbors, size, _starts(start), _goal_test(goal), heuristic, track_path
+    )
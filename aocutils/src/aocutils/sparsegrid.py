@@ -0,0 +1,164 @@
+"""
+An unbounded grid whose memory grows with the area in use rather than its extent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from .grid import OFFSETS8, Bounds, Cell, Grid, Point, pack_point, unpack_point
+
+
+class SparseGrid:
+    """A grid of single-character cells with no fixed width or height.
+
+    Cells are stored in square chunks of ``chunk_size`` by ``chunk_size`` cells, each
+    a ``bytearray`` allocated the first time one of its cells is written. Every cell
+    initially holds ``fill``; cells holding anything else are considered occupied.
+
+    As any point is within the grid, cells are identified by their packed point (see
+    :func:`pack_point`) where a :class:`Grid` would use an index into its cells.
+    Packing limits coordinates to ``-2**31 <= value < 2**31``. As neighbors are found
+    by adding to packed points, cells in the first or last column of that range get
+    neighbors from the opposite column, one row away.
+    """
+
+    def __init__(self, fill: str = ".", chunk_size: int = 64) -> None:
+        if chunk_size <= 0 or chunk_size & (chunk_size - 1):
+            raise ValueError("The chunk size must be a power of two.")
+
+        self.fill = fill
+        self.chunk_size = chunk_size
+        self.chunks: dict[tuple[int, int], bytearray] = {}
+
+        self._fill_value = ord(fill)
+        self._shift = chunk_size.bit_length() - 1
+        self._mask = chunk_size - 1
+
+        # the bounding box of every cell that was occupied at some point
+        self._left = self._top = self._right = self._bottom = 0
+
+        # offsets to the neighbors of a packed point, in the order of OFFSETS8
+        origin = pack_point(0, 0)
+        self.index_offsets = tuple(pack_point(dx, dy) - origin for dx, dy in OFFSETS8)
+        self._index_offsets4 = self.index_offsets[:4]
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        fill: str = ".",
+        origin: Point = Point(0, 0),
+        chunk_size: int = 64,
+    ) -> SparseGrid:
+        """Creates a grid from ``lines``, each line being a row of the grid whose
+        first cell is placed at ``origin``. Cells holding ``fill`` are not stored."""
+        grid = cls(fill, chunk_size)
+
+        for y, line in enumerate(lines, origin.y):
+            for x, value in enumerate(line, origin.x):
+                if value != fill:
+                    grid.put(Point(x, y), value)
+
+        return grid
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """The smallest box containing every cell that has been occupied, or None if
+        no cell has been. The box only ever expands."""
+        if not self.chunks:
+            return None
+
+        return Bounds(self._left, self._top, self._right, self._bottom)
+
+    def _locate(self, x: int, y: int) -> tuple[tuple[int, int], int]:
+        shift, mask = self._shift, self._mask
+        return (x >> shift, y >> shift), (y & mask) * self.chunk_size + (x & mask)
+
+    def index(self, point: Point) -> int:
+        """Returns the packed form of ``point``."""
+        return point.pack()
+
+    def point(self, index: int) -> Point:
+        """Returns the point packed into ``index``."""
+        return unpack_point(index)
+
+    def at(self, point: Point) -> Cell:
+        return Cell(self, point)  # type: ignore
+
+    def get(self, point: Point) -> str:
+        """Returns the value of the cell at ``point``."""
+        key, offset = self._locate(point.x, point.y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            return self.fill
+
+        return chr(chunk[offset])
+
+    def put(self, point: Point, value: str) -> None:
+        x, y = point
+        key, offset = self._locate(x, y)
+
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if value == self.fill:
+                return
+
+            chunk = self.chunks[key] = bytearray([self._fill_value]) * (
+                self.chunk_size * self.chunk_size
+            )
+
+            if len(self.chunks) == 1:
+                self._left, self._top, self._right, self._bottom = x, y, x + 1, y + 1
+
+        chunk[offset] = ord(value)
+
+        if value != self.fill:
+            self._left, self._right = min(self._left, x), max(self._right, x + 1)
+            self._top, self._bottom = min(self._top, y), max(self._bottom, y + 1)
+
+    def is_valid(self, point: Point) -> bool:
+        """Always True, as a sparse grid has no bounds."""
+        return True
+
+    def neighbors4(self, index: int) -> Iterator[int]:
+        """Yields the packed points orthogonally adjacent to the packed point
+        ``index``, in the order of :data:`OFFSETS4`."""
+        return map(index.__add__, self._index_offsets4)
+
+    def neighbors8(self, index: int) -> Iterator[int]:
+        """Yields the packed points orthogonally or diagonally adjacent to the packed
+        point ``index``, in the order of :data:`OFFSETS8`."""
+        return map(index.__add__, self.index_offsets)
+
+    def items(self) -> Iterator[tuple[Point, str]]:
+        """Yields the point and value of every occupied cell, chunk by chunk."""
+        size, fill = self.chunk_size, self._fill_value
+
+        for (chunk_x, chunk_y), chunk in self.chunks.items():
+            for offset, value in enumerate(chunk):
+                if value != fill:
+                    y, x = divmod(offset, size)
+                    yield Point(chunk_x * size + x, chunk_y * size + y), chr(value)
+
+    def __len__(self) -> int:
+        """Returns the amount of occupied cells."""
+        fill = self._fill_value
+        return sum(len(chunk) - chunk.count(fill) for chunk in self.chunks.values())
+
+    def __contains__(self, point: Point) -> bool:
+        """Returns whether the cell at ``point`` is occupied."""
+        return self.get(point) != self.fill
+
+    def to_grid(self) -> Grid:
+        """Returns a :class:`Grid` holding the cells within :attr:`bounds`."""
+        bounds = self.bounds
+        if bounds is None:
+            return Grid(0, 0)
+
+        left, top, right, bottom = bounds
+        grid = Grid(right - left, bottom - top, self.fill)
+        for point, value in self.items():
+            grid.put(Point(point.x - left, point.y - top), value)
+
+        return grid
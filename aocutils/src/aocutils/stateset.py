@@ -0,0 +1,72 @@
+"""
+A compact set of (cell index, direction) states for detecting loops in simulations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+# the amount of bits set in each possible byte
+_BIT_COUNTS = bytes(bin(value).count("1") for value in range(256))
+
+
+class StateSet:
+    """A set of states, each being a cell index in ``range(size)`` and a direction in
+    ``range(directions)``.
+
+    Each cell takes a single byte whose bits flag the directions it was added with,
+    so at most 8 directions are supported. Clearing the set reuses its buffer, which
+    allows a single set to be shared by many simulations over the same grid.
+    """
+
+    __slots__ = ("size", "directions", "_limit", "_flags", "_empty")
+
+    def __init__(self, size: int, directions: int = 4) -> None:
+        if not 1 <= directions <= 8:
+            raise ValueError("A state set supports between 1 and 8 directions.")
+
+        self.size = size
+        self.directions = directions
+        self._limit = 1 << directions
+
+        self._flags = bytearray(size)
+        self._empty = bytes(size)
+
+    def add(self, index: int, direction: int) -> bool:
+        """Adds the state (index, direction). Returns whether it was not already in
+        the set."""
+        bit = 1 << direction
+        if bit >= self._limit:
+            raise ValueError(f"Direction {direction} is out of range.")
+
+        flags = self._flags[index]
+        if flags & bit:
+            return False
+
+        self._flags[index] = flags | bit
+        return True
+
+    def contains(self, index: int, direction: int) -> bool:
+        """Returns whether the state (index, direction) is in the set."""
+        return bool(self._flags[index] >> direction & 1)
+
+    def __contains__(self, state: tuple[int, int]) -> bool:
+        return self.contains(*state)
+
+    def clear(self) -> None:
+        """Removes every state from the set without reallocating its buffer."""
+        self._flags[:] = self._empty
+
+    def cells(self) -> Iterator[int]:
+        """Yields the index of every cell with at least one state in the set."""
+        flags = self._flags
+        for index in range(self.size):
+            if flags[index]:
+                yield index
+
+    def cell_count(self) -> int:
+        """Returns the amount of cells with at least one state in the set."""
+        return self.size - self._flags.count(0)
+
+    def __len__(self) -> int:
+        return sum(self._flags.translate(_BIT_COUNTS))
@@ -0,0 +1,96 @@
+"""
+Microbenchmark comparing ``aocutils.Point`` against the frozen dataclass it
+replaced and against packed integer keys.
+
+Usage (from the project root):
+
+    python benchmarks/bench_point.py [-n NUMBER]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "aocutils" / "src"))
+
+from aocutils import Point, pack_point  # noqa: E402
+
+
+@dataclass(frozen=True, order=True)
+class DataclassPoint:
+    x: int
+    y: int
+
+    def __add__(self, other: DataclassPoint) -> DataclassPoint:
+        return DataclassPoint(self.x + other.x, self.y + other.y)
+
+
+SIDE = 64
+
+
+CASES = {
+    "construct": "P(3, 4)",
+    "add": "a + b",
+    "hash": "hash(a)",
+    "set membership": "a in seen",
+    "build set": "set(points)",
+    "sort": "sorted(points, reverse=True)",
+}
+
+
+def setup_for(point_type: type) -> dict[str, object]:
+    points = [point_type(x, y) for y in range(SIDE) for x in range(SIDE)]
+    return {
+        "P": point_type,
+        "a": point_type(3, 4),
+        "b": point_type(-1, 0),
+        "points": points,
+        "seen": set(points),
+    }
+
+
+def packed_setup() -> dict[str, object]:
+    points = [pack_point(x, y) for y in range(SIDE) for x in range(SIDE)]
+    return {
+        "P": pack_point,
+        "a": pack_point(3, 4),
+        "b": pack_point(-1, 0) - pack_point(0, 0),
+        "points": points,
+        "seen": set(points),
+    }
+
+
+def run(number: int) -> None:
+    contenders = {
+        "dataclass": setup_for(DataclassPoint),
+        "Point": setup_for(Point),
+        "packed int": packed_setup(),
+    }
+
+    header = f"{'case':<16}" + "".join(f"{name:>14}" for name in contenders)
+    print(header + f"{'speedup':>10}")
+
+    for case, stmt in CASES.items():
+        # whole-collection cases are much slower per call
+        repeat = max(1, number // 1000) if case in ("build set", "sort") else number
+
+        timings = {
+            name: min(timeit.repeat(stmt, globals=env, number=repeat, repeat=5))
+            / repeat
+            for name, env in contenders.items()
+        }
+        row = f"{case:<16}" + "".join(
+            f"{timings[name] * 1e9:>11.1f} ns" for name in contenders
+        )
+        print(row + f"{timings['dataclass'] / timings['Point']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--number", type=int, default=200_000)
+
+    run(parser.parse_args().number)
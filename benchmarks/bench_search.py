@@ -0,0 +1,115 @@
+"""
+Benchmarks the searches in ``aocutils.search`` on large open and maze-like grids,
+comparing them against a straightforward BFS over sets of points.
+
+Usage (from the project root):
+
+    python benchmarks/bench_search.py [--size SIZE] [--seed SEED]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "aocutils" / "src"))
+
+from aocutils import Grid, Point  # noqa: E402
+from aocutils.search import astar, bfs, dijkstra  # noqa: E402
+
+
+def open_grid(size: int) -> Grid:
+    return Grid(size, size, ".")
+
+
+def maze_grid(size: int, seed: int) -> Grid:
+    """Returns a maze with a single path between any two open cells."""
+    size -= 1 - size % 2  # mazes need an odd size
+    grid = Grid(size, size, "#")
+    rng = random.Random(seed)
+
+    stack = [Point(1, 1)]
+    grid.put(stack[0], ".")
+    while stack:
+        current = stack[-1]
+        options = [
+            (current + Point(dx, dy), current + Point(dx // 2, dy // 2))
+            for dx, dy in ((0, -2), (0, 2), (-2, 0), (2, 0))
+            if 0 < current.x + dx < size - 1 and 0 < current.y + dy < size - 1
+        ]
+        options = [option for option in options if grid.get(option[0]) == "#"]
+        if not options:
+            stack.pop()
+            continue
+
+        cell, wall = rng.choice(options)
+        grid.put(wall, ".")
+        grid.put(cell, ".")
+        stack.append(cell)
+
+    return grid
+
+
+def naive_bfs(grid: Grid, start: Point, goal: Point) -> int | None:
+    """A BFS using a deque of points and a set of visited points."""
+    queue = deque([(start, 0)])
+    seen = {start}
+    while queue:
+        point, cost = queue.popleft()
+        if point == goal:
+            return cost
+
+        for offset in (Point(0, -1), Point(0, 1), Point(-1, 0), Point(1, 0)):
+            neighbor = point + offset
+            if (
+                neighbor not in seen
+                and grid.is_valid(neighbor)
+                and grid.get(neighbor) != "#"
+            ):
+                seen.add(neighbor)
+                queue.append((neighbor, cost + 1))
+
+    return None
+
+
+def timed(function: Callable[[], object]) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def run(size: int, seed: int) -> None:
+    for name, grid in (("open", open_grid(size)), ("maze", maze_grid(size, seed))):
+        start = Point(1, 1)
+        goal = Point(grid.width - 2, grid.height - 2)
+        start_index, goal_index = grid.index(start), grid.index(goal)
+
+        cases: dict[str, Callable[[], object]] = {
+            "naive BFS": lambda: naive_bfs(grid, start, goal),
+            "bfs": lambda: bfs(grid, start_index, goal_index).cost,
+            "bfs + path": lambda: len(
+                bfs(grid, start_index, goal_index, track_path=True).path()
+            )
+            - 1,
+            "dijkstra": lambda: dijkstra(grid, start_index, goal_index).cost,
+            "astar": lambda: astar(grid, start_index, goal_index).cost,
+        }
+
+        print(f"{name} grid ({grid.width}x{grid.height})")
+        for case, function in cases.items():
+            elapsed, cost = timed(function)
+            print(f"  {case:<12}{elapsed * 1000:>10.1f} ms   cost={cost}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=501)
+    parser.add_argument("--seed", type=int, default=2024)
+
+    args = parser.parse_args()
+    run(args.size, args.seed)
@@ -0,0 +1,143 @@
+"""
+Measures the cold start of a trivial solution using ``python -X importtime`` and
+fails if the time spent importing its dependencies goes over a budget.
+
+Import times vary a lot between machines, so the budget applies to the time spent
+beyond importing the standard library modules any command line tool needs
+(``REFERENCE_IMPORTS``), measured alongside it.
+
+Usage (from the project root):
+
+    python benchmarks/bench_startup.py [-n NUMBER] [--budget MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parents[1]
+
+# a trivial day: parsing and solving take well under a millisecond
+SOLUTION = Path("2022") / "day01.py"
+TRIVIAL_INPUT = "1000\n2000\n\n3000\n"
+
+# what a minimal command line tool reading files would import anyway
+REFERENCE_IMPORTS = "import argparse, pathlib, re"
+
+
+def get_env() -> dict[str, str]:
+    paths = [str(ROOT / "aocgen" / "src"), str(ROOT / "aocutils" / "src")]
+    if "PYTHONPATH" in os.environ:
+        paths.append(os.environ["PYTHONPATH"])
+
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(paths)}
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Gets the cumulative import time (in microseconds) of each top-level import
+    from the output of ``-X importtime``."""
+    imports = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not cumulative_us.strip().isdigit():
+            continue  # the header line
+
+        # nested imports are indented by two more spaces per level
+        if not name[1:].startswith(" "):
+            imports[name.strip()] = int(cumulative_us)
+
+    return imports
+
+
+def run_importtime(args: list[str]) -> tuple[float, dict[str, int]]:
+    """Runs Python with ``args`` under ``-X importtime``, returning the wall time
+    in milliseconds and the top-level imports."""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=get_env(),
+        cwd=ROOT,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if process.returncode != 0:
+        raise RuntimeError(f"{args} failed:\n{process.stderr}")
+
+    return elapsed, parse_importtime(process.stderr)
+
+
+def run(number: int, budget: float) -> bool:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as fp:
+        fp.write(TRIVIAL_INPUT)
+
+    try:
+        _, baseline = run_importtime(["-c", "pass"])
+
+        walls, import_times, reference_times = [], [], []
+        costs: dict[str, list[int]] = {}
+        for _ in range(number):
+            # alternate with the reference so that both see the same system load
+            _, imports = run_importtime(["-c", REFERENCE_IMPORTS])
+            reference_times.append(
+                sum(v for k, v in imports.items() if k not in baseline) / 1000
+            )
+
+            wall, imports = run_importtime([str(SOLUTION), "1", "-I", fp.name])
+            walls.append(wall)
+
+            # modules imported by the interpreter itself are not the solution's cost
+            own_imports = {k: v for k, v in imports.items() if k not in baseline}
+            import_times.append(sum(own_imports.values()) / 1000)
+            for name, cost in own_imports.items():
+                costs.setdefault(name, []).append(cost)
+    finally:
+        os.unlink(fp.name)
+
+    import_ms = statistics.median(import_times)
+    reference_ms = statistics.median(reference_times)
+    overhead_ms = import_ms - reference_ms
+    print(f"{SOLUTION} ({number} runs, median)")
+    print(f"  wall time:   {statistics.median(walls):8.2f} ms")
+    print(f"  import time: {import_ms:8.2f} ms")
+    print(f"  reference:   {reference_ms:8.2f} ms ({REFERENCE_IMPORTS})")
+    print(f"  overhead:    {overhead_ms:8.2f} ms (budget: {budget:.2f} ms)")
+    print("  slowest top-level imports:")
+
+    slowest = sorted(costs.items(), key=lambda item: statistics.median(item[1]))
+    for name, times in reversed(slowest[-10:]):
+        print(f"    {statistics.median(times) / 1000:8.2f} ms  {name}")
+
+    if overhead_ms > budget:
+        print(f"FAIL: import time is over budget by {overhead_ms - budget:.2f} ms")
+        return False
+
+    print("OK")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--number", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="maximum median import time beyond the reference in milliseconds",
+    )
+    args = parser.parse_args()
+
+    if not run(args.number, args.budget):
+        sys.exit(1)